@@ -11,23 +11,24 @@ from pathlib import Path
 
 DATA_ROOT = Path("data/cifar10")
 
+BATCHES_DIR = DATA_ROOT / "cifar-10-batches-py"
+
 def main():
+    if BATCHES_DIR.exists():
+        print(f"CIFAR-10 already present at {DATA_ROOT.resolve()}")
+        return
+
     DATA_ROOT.mkdir(parents=True, exist_ok=True)
 
-    # Train split
+    # One archive holds both splits, so downloading the train split also
+    # extracts the test batches. Constructing the test split as well would
+    # only MD5 every batch file a second time.
     datasets.CIFAR10(
         root=DATA_ROOT,
         train=True,
         download=True,
     )
 
-    # Test split
-    datasets.CIFAR10(
-        root=DATA_ROOT,
-        train=False,
-        download=True,
-    )
-
     print(f"CIFAR-10 downloaded to {DATA_ROOT.resolve()}")
 
 if __name__ == "__main__":
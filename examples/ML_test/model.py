@@ -15,6 +15,6 @@ class SimpleCNN(nn.Module):
         x = F.max_pool2d(x, 2)
         x = F.relu(self.conv2(x))
         x = F.max_pool2d(x, 2)
-        x = x.view(x.size(0), -1)
+        x = torch.flatten(x, 1)  # view() fails on channels_last activations
         return self.fc1(x)
 
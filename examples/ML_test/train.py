@@ -1,43 +1,122 @@
 # train.py
+import os
+import warnings
 import torch
 import torch.optim as optim
-from torchvision import datasets, transforms
+from torch.utils.data import Dataset
+from torchvision import datasets
 from model import SimpleCNN
 
 BATCH_SIZE = 64
 EPOCHS = 1
 LR = 0.01
+NUM_WORKERS = min(8, os.cpu_count() or 1)
+
+class CIFAR10Tensors(Dataset):
+    """CIFAR-10 held as one uint8 tensor; skips the per-sample PIL/ToTensor path."""
+
+    def __init__(self, root, train=True):
+        raw = datasets.CIFAR10(root=root, train=train, download=False)
+        # (N, 32, 32, 3) uint8 -> (N, 3, 32, 32), same layout ToTensor produces
+        self.data = torch.from_numpy(raw.data).permute(0, 3, 1, 2).contiguous()
+        self.labels = torch.tensor(raw.targets, dtype=torch.long)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __getitem__(self, i):
+        return self.data[i].float().div_(255.0), self.labels[i]
+
+class CUDAPrefetcher:
+    """Copy the next batch to the GPU on a side stream while the current one trains."""
+
+    def __init__(self, loader, device):
+        self.loader = iter(loader)
+        self.device = device
+        self.stream = torch.cuda.Stream()
+        self._preload()
+
+    def _preload(self):
+        self.next_images, self.next_labels = next(self.loader, (None, None))
+        if self.next_images is None:
+            return
+        with torch.cuda.stream(self.stream):
+            self.next_images = self.next_images.to(
+                self.device, memory_format=torch.channels_last, non_blocking=True
+            )
+            self.next_labels = self.next_labels.to(self.device, non_blocking=True)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        torch.cuda.current_stream().wait_stream(self.stream)
+        images, labels = self.next_images, self.next_labels
+        if images is None:
+            raise StopIteration
+        images.record_stream(torch.cuda.current_stream())
+        labels.record_stream(torch.cuda.current_stream())
+        self._preload()
+        return images, labels
 
 def main():
-    transform = transforms.Compose([
-        transforms.ToTensor(),
-    ])
-
-    trainset = datasets.CIFAR10(
-        root="data/cifar10",
-        train=True,
-        download=False,
-        transform=transform
-    )
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+    trainset = CIFAR10Tensors(root="data/cifar10", train=True)
 
+    # Worker processes prefetch batches so the training loop never waits on decoding
     trainloader = torch.utils.data.DataLoader(
         trainset,
         batch_size=BATCH_SIZE,
-        shuffle=True
+        shuffle=True,
+        num_workers=NUM_WORKERS,
+        pin_memory=torch.cuda.is_available(),
+        persistent_workers=True,
+        prefetch_factor=2
     )
 
-    model = SimpleCNN()
+    model = SimpleCNN().to(device)
+
+    # Mixed precision with NHWC activations on GPU; bf16 needs no loss scaling
+    use_amp = device.type == "cuda"
+    amp_dtype = torch.bfloat16 if use_amp and torch.cuda.is_bf16_supported() else torch.float16
+    if use_amp:
+        model = model.to(memory_format=torch.channels_last)
+    # torch.amp.GradScaler is new in torch 2.3; older releases only have the cuda alias
+    use_scaler = use_amp and amp_dtype == torch.float16
+    if hasattr(torch.amp, "GradScaler"):
+        scaler = torch.amp.GradScaler("cuda", enabled=use_scaler)
+    else:
+        scaler = torch.cuda.amp.GradScaler(enabled=use_scaler)
+
+    # Compiled wrapper shares parameters with `model`; the plain module is what gets saved
+    net = model
+    if device.type == "cuda" and hasattr(torch, "compile"):
+        # Compilation is lazy: run one forward pass so backend failures surface here
+        try:
+            compiled = torch.compile(model, mode="reduce-overhead")
+            warmup = torch.zeros(BATCH_SIZE, 3, 32, 32, device=device)
+            warmup = warmup.to(memory_format=torch.channels_last)
+            with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=use_amp):
+                compiled(warmup)
+            net = compiled
+        except Exception as e:
+            warnings.warn(f"torch.compile failed, training eagerly: {e}")
+
     optimizer = optim.SGD(model.parameters(), lr=LR)
     criterion = torch.nn.CrossEntropyLoss()
 
     model.train()
     for epoch in range(EPOCHS):
-        for images, labels in trainloader:
-            optimizer.zero_grad()
-            outputs = model(images)
-            loss = criterion(outputs, labels)
-            loss.backward()
-            optimizer.step()
+        batches = CUDAPrefetcher(trainloader, device) if device.type == "cuda" else trainloader
+        for images, labels in batches:
+            optimizer.zero_grad(set_to_none=True)
+            with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=use_amp):
+                outputs = net(images)
+                loss = criterion(outputs, labels)
+            scaler.scale(loss).backward()
+            scaler.step(optimizer)
+            scaler.update()
 
     torch.save(model.state_dict(), "model.pt")
     print("Training complete. Model saved to model.pt")
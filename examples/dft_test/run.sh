@@ -7,16 +7,16 @@
 """Calculate energy of H2 molecule using EMT calculator"""
 from ase import Atoms
 from ase.calculators.emt import EMT
-from ase.optimize import BFGS
+from ase.optimize import LBFGS
 import json
 
 # Read structure
 atoms = Atoms('H2', positions=[(0, 0, 0), (0, 0, 0.74)])
 atoms.calc = EMT()
 
-# Optimize
-opt = BFGS(atoms, logfile='opt.log')
-opt.run(fmax=0.01)
+# Optimize (limited-memory BFGS: no dense inverse Hessian)
+opt = LBFGS(atoms, logfile='opt.log', memory=10, maxstep=0.2)
+converged = opt.run(fmax=0.01, steps=200)
 
 # Calculate energy
 energy = atoms.get_potential_energy()
@@ -25,7 +25,7 @@ energy = atoms.get_potential_energy()
 result = {
     'energy_eV': energy,
     'positions': atoms.positions.tolist(),
-    'converged': True
+    'converged': bool(converged)
 }
 
 with open('result.json', 'w') as f:
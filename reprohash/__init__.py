@@ -13,10 +13,29 @@ __version__ = "2.1.8"
 __author__ = "ReproHash Contributors"
 __license__ = "Apache-2.0"
 
-from .snapshot import Snapshot, create_snapshot, SourceType
-from .verify import verify_snapshot, verify_runrecord, VerificationOutcome
-from .runrecord import RunRecord, ReproducibilityClass
-from .bundle import ZenodoBundle, verify_bundle
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .snapshot import Snapshot, create_snapshot, SourceType
+    from .verify import verify_snapshot, verify_runrecord, VerificationOutcome
+    from .runrecord import RunRecord, ReproducibilityClass
+    from .bundle import ZenodoBundle, verify_bundle
+
+# Public name -> defining submodule. Submodules are imported on first
+# attribute access, so e.g. the CLI's snapshot command never loads bundle
+# or the environment plugins.
+_EXPORTS = {
+    "Snapshot": "snapshot",
+    "create_snapshot": "snapshot",
+    "SourceType": "snapshot",
+    "verify_snapshot": "verify",
+    "verify_runrecord": "verify",
+    "VerificationOutcome": "verify",
+    "RunRecord": "runrecord",
+    "ReproducibilityClass": "runrecord",
+    "ZenodoBundle": "bundle",
+    "verify_bundle": "bundle",
+}
 
 __all__ = [
     "Snapshot",
@@ -30,3 +49,20 @@ __all__ = [
     "ZenodoBundle",
     "verify_bundle",
 ]
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported public names."""
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -9,15 +9,26 @@ Bundle manifest cryptographically binds:
 - Provenance relationships
 """
 
+import os
+import hmac
 import json
 import hashlib
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 
 VERSION = "2.1"
 VERIFICATION_PROFILE = "reprohash-v2.1-strict"
 
+# Bundle files are written compact; set REPROHASH_PRETTY=1 for indented
+# output. Read when each file is written, so it may be set after import.
+PRETTY_ENV = "REPROHASH_PRETTY"
+
+# Built once; json.dumps() constructs a new encoder on every call
+# whenever non-default options are passed.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
 
 def canonical_json(obj: Any) -> str:
     """
@@ -34,7 +45,38 @@ def canonical_json(obj: Any) -> str:
     - Unicode: No explicit normalization (assumes NFC)
     - Relies on: Python json module semantics
     """
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return _CANONICAL_ENCODER.encode(obj)
+
+
+def _digests_equal(a: Any, b: Any) -> bool:
+    """
+    Compare two hex digests with hmac.compare_digest.
+    
+    Manifest values are untrusted JSON, so anything that is not an
+    ASCII string (None, numbers, non-ASCII text) falls back to ==.
+    """
+    if isinstance(a, str) and isinstance(b, str) and a.isascii() and b.isascii():
+        return hmac.compare_digest(a, b)
+    return a == b
+
+
+def _read_component(path: str) -> Tuple[Optional[bytes], Optional[str], Optional[Exception]]:
+    """
+    Read and hash one component file for verify_bundle.
+    
+    The bytes are kept so later steps can parse them without
+    reopening the file.
+    
+    Returns (content, sha256, None) on success and (None, None, error)
+    if the file could not be read. verify_bundle reports missing files
+    before reading, so a file that vanishes in between is a read error.
+    """
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+        return content, hashlib.sha256(content).hexdigest(), None
+    except Exception as e:
+        return None, None, e
 
 
 class ZenodoBundle:
@@ -73,25 +115,20 @@ class ZenodoBundle:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Write input snapshot
-        snapshot_file = output_path / "snapshot.json"
-        with open(snapshot_file, "w") as f:
-            json.dump(self.input_snapshot.to_dict(), f, indent=2)
-        snapshot_file_hash = self._hash_file(snapshot_file)
-        
-        # Write runrecord
-        runrecord_file = output_path / "runrecord.json"
-        with open(runrecord_file, "w") as f:
-            json.dump(self.runrecord.to_dict(), f, indent=2)
-        runrecord_file_hash = self._hash_file(runrecord_file)
+        # Write components (each hashed from the bytes written, not re-read)
+        snapshot_file_hash = self._write_component(
+            output_path / "snapshot.json", self.input_snapshot.to_dict()
+        )
+        runrecord_file_hash = self._write_component(
+            output_path / "runrecord.json", self.runrecord.to_dict()
+        )
         
         # Write output snapshot if present
         output_file_hash = None
         if self.output_snapshot:
-            output_snapshot_file = output_path / "output_snapshot.json"
-            with open(output_snapshot_file, "w") as f:
-                json.dump(self.output_snapshot.to_dict(), f, indent=2)
-            output_file_hash = self._hash_file(output_snapshot_file)
+            output_file_hash = self._write_component(
+                output_path / "output_snapshot.json", self.output_snapshot.to_dict()
+            )
         
         # Components section is authoritative
         components = {
@@ -136,57 +173,70 @@ class ZenodoBundle:
         }
         
         # Compute bundle hash (over semantic manifest only)
-        self.bundle_hash = hashlib.sha256(
-            canonical_json(manifest_for_hash).encode('utf-8')
-        ).hexdigest()
-        
-        # Derived fields added AFTER hash computation
-        manifest_final = manifest_for_hash.copy()
-        manifest_final["bundle_hash"] = self.bundle_hash
-        
-        # Provenance summary (informational only, not in hash)
-        manifest_final["provenance_summary"] = {
-            "note": "Informational only. Not included in bundle_hash.",
-            "input": self.input_snapshot.content_hash[:16] + "...",
-            "run": self.runrecord.run_id[:16] + "...",
-            "output": self.output_snapshot.content_hash[:16] + "..." if self.output_snapshot else None
-        }
+        canonical_manifest = canonical_json(manifest_for_hash).encode('utf-8')
+        self.bundle_hash = hashlib.sha256(canonical_manifest).hexdigest()
         
-        # File list (derived from components)
-        manifest_final["files"] = [
-            {
-                "name": comp["file"],
-                "sha256": comp["file_sha256"],
-                "role": role,
-                "note": "Derived from components section"
+        # Derived fields added AFTER hash computation (built in one pass)
+        manifest_final = {
+            **manifest_for_hash,
+            "bundle_hash": self.bundle_hash,
+            
+            # Provenance summary (informational only, not in hash)
+            "provenance_summary": {
+                "note": "Informational only. Not included in bundle_hash.",
+                "input": self.input_snapshot.content_hash[:16] + "...",
+                "run": self.runrecord.run_id[:16] + "...",
+                "output": self.output_snapshot.content_hash[:16] + "..." if self.output_snapshot else None
+            },
+            
+            # File list (derived from components)
+            "files": [
+                {
+                    "name": comp["file"],
+                    "sha256": comp["file_sha256"],
+                    "role": role,
+                    "note": "Derived from components section"
+                }
+                for role, comp in components.items()
+            ],
+            
+            # Integrity note
+            "integrity": {
+                "sealed": True,
+                "tamper_evident": True,
+                "note": (
+                    "bundle_hash cryptographically binds: version, bundle_type, "
+                    "verification_profile, and all components. "
+                    "Provenance summary and file list are derived (not in hash). "
+                    "Modifications to bundle_hash computation, components, or "
+                    "verification profile will be detectable."
+                )
             }
-            for role, comp in components.items()
-        ]
-        
-        # Integrity note
-        manifest_final["integrity"] = {
-            "sealed": True,
-            "tamper_evident": True,
-            "note": (
-                "bundle_hash cryptographically binds: version, bundle_type, "
-                "verification_profile, and all components. "
-                "Provenance summary and file list are derived (not in hash). "
-                "Modifications to bundle_hash computation, components, or "
-                "verification profile will be detectable."
-            )
         }
         
         # Write sealed manifest
-        manifest_file = output_path / "MANIFEST.json"
-        with open(manifest_file, "w") as f:
-            json.dump(manifest_final, f, indent=2)
+        self._write_json(output_path / "MANIFEST.json", manifest_final)
         
         return self.bundle_hash
     
-    def _hash_file(self, path: Path) -> str:
-        """Hash a file."""
-        with open(path, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()
+    def _write_component(self, path: Path, obj: Dict[str, Any]) -> str:
+        """
+        Write a component file and return its SHA-256.
+        
+        The serialized bytes are hashed before writing, so the file
+        is never read back.
+        """
+        return hashlib.sha256(self._write_json(path, obj)).hexdigest()
+    
+    def _write_json(self, path: Path, obj: Dict[str, Any]) -> bytes:
+        """Serialize obj, write it with a single write, return the bytes."""
+        if os.environ.get(PRETTY_ENV, "0") == "1":
+            payload = json.dumps(obj, indent=2).encode('utf-8')
+        else:
+            payload = json.dumps(obj, separators=(',', ':')).encode('utf-8')
+        with open(path, "wb") as f:
+            f.write(payload)
+        return payload
 
 
 def verify_bundle(bundle_dir: str, data_dir: str = None):
@@ -201,6 +251,8 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
     5. Optional: Input data verification (if data_dir provided)
     
     This is FULL semantic verification, not just coherence.
+    Verification stops at the first step that records a FAIL, so
+    later (more expensive) steps never run on a broken bundle.
     
     Args:
         bundle_dir: Bundle directory
@@ -208,7 +260,10 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
     
     Returns: VerificationResult
     """
-    from .verify import VerificationResult, VerificationOutcome, verify_snapshot, verify_runrecord
+    from .verify import (
+        VerificationResult, VerificationOutcome, verify_snapshot,
+        _load_runrecord, _verify_runrecord_data
+    )
     
     result = VerificationResult(VerificationOutcome.PASS_INPUT_INTEGRITY)
     bundle_path = Path(bundle_dir)
@@ -222,8 +277,7 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
         return result
     
     try:
-        with open(manifest_file, 'r') as f:
-            manifest = json.load(f)
+        manifest = json.loads(manifest_file.read_bytes())
     except Exception as e:
         result.add_error(f"Could not read bundle manifest: {e}")
         return result
@@ -249,7 +303,7 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
         canonical_json(manifest_for_hash).encode('utf-8')
     ).hexdigest()
     
-    if computed_hash != claimed_hash:
+    if not _digests_equal(computed_hash, claimed_hash):
         result.add_error(
             f"Bundle seal broken (integrity violation). "
             f"Expected: {claimed_hash[:16]}..., "
@@ -268,28 +322,43 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
     
     # === STEP 2: Verify component file integrity ===
     components = manifest['components']
+    bundle_prefix = str(bundle_path) + os.sep
+    component_items = list(components.items())
     
-    for role, comp in components.items():
-        file_path = bundle_path / comp['file']
-        
-        if not file_path.exists():
+    # Fail fast on missing files before doing any hashing
+    for role, comp in component_items:
+        if not os.path.exists(bundle_prefix + comp['file']):
             result.add_error(f"Component file missing: {comp['file']} ({role})")
+    if result.outcome == VerificationOutcome.FAIL:
+        return result
+    
+    # Read and hash all component files concurrently (hashlib releases the GIL)
+    workers = max(1, min(len(component_items), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        read_results = list(executor.map(
+            _read_component,
+            [bundle_prefix + comp['file'] for _, comp in component_items]
+        ))
+    
+    # Bytes of integrity-checked components, parsed in step 3
+    component_bytes: Dict[str, bytes] = {}
+    
+    for (role, comp), (content, actual_hash, read_error) in zip(component_items, read_results):
+        if read_error is not None:
+            result.add_inconclusive(
+                f"Could not read component file {comp['file']}: {read_error}"
+            )
             continue
         
-        try:
-            with open(file_path, 'rb') as f:
-                actual_hash = hashlib.sha256(f.read()).hexdigest()
-            
-            if actual_hash != comp['file_sha256']:
-                result.add_error(
-                    f"Component file modified: {comp['file']} ({role}) "
-                    f"(expected: {comp['file_sha256'][:16]}..., "
-                    f"got: {actual_hash[:16]}...)"
-                )
-        except Exception as e:
-            result.add_inconclusive(
-                f"Could not read component file {comp['file']}: {e}"
+        if not _digests_equal(actual_hash, comp['file_sha256']):
+            result.add_error(
+                f"Component file modified: {comp['file']} ({role}) "
+                f"(expected: {comp['file_sha256'][:16]}..., "
+                f"got: {actual_hash[:16]}...)"
             )
+            continue
+        
+        component_bytes[role] = content
     
     # If file integrity failed, stop here
     if result.outcome == VerificationOutcome.FAIL:
@@ -297,14 +366,18 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
     
     # === STEP 3: Verify component seals ===
     
+    output_component = components.get('output_snapshot')
+    
     # Verify snapshot seal
-    snapshot_file = bundle_path / components['input_snapshot']['file']
+    snapshot_file = bundle_prefix + components['input_snapshot']['file']
     try:
-        with open(snapshot_file) as f:
-            snapshot_data = json.load(f)
+        snapshot_data = json.loads(component_bytes['input_snapshot'])
         
         # Check content_hash matches
-        if snapshot_data['content_hash'] != components['input_snapshot']['content_hash']:
+        if not _digests_equal(
+            snapshot_data['content_hash'],
+            components['input_snapshot']['content_hash']
+        ):
             result.add_error(
                 "Snapshot content_hash mismatch "
                 "(file content doesn't match bundle manifest)"
@@ -312,9 +385,12 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
     except Exception as e:
         result.add_inconclusive(f"Could not verify snapshot seal: {e}")
     
-    # Verify runrecord seal
-    runrecord_file = bundle_path / components['runrecord']['file']
-    rr_result = verify_runrecord(str(runrecord_file))
+    # Verify runrecord seal (parsed once, reused for provenance in step 4)
+    runrecord_file = bundle_prefix + components['runrecord']['file']
+    rr_result = VerificationResult(VerificationOutcome.PASS_INPUT_INTEGRITY)
+    rr_data = _load_runrecord(runrecord_file, rr_result, component_bytes.get('runrecord'))
+    if rr_data is not None:
+        _verify_runrecord_data(rr_data, rr_result)
     
     if rr_result.outcome == VerificationOutcome.FAIL:
         for err in rr_result.errors:
@@ -324,13 +400,11 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
             result.add_inconclusive(f"RunRecord verification inconclusive: {reason}")
     
     # Verify output snapshot if present
-    if 'output_snapshot' in components:
-        output_file = bundle_path / components['output_snapshot']['file']
+    if output_component is not None:
         try:
-            with open(output_file) as f:
-                output_data = json.load(f)
+            output_data = json.loads(component_bytes['output_snapshot'])
             
-            if output_data['content_hash'] != components['output_snapshot']['content_hash']:
+            if not _digests_equal(output_data['content_hash'], output_component['content_hash']):
                 result.add_error(
                     "Output snapshot content_hash mismatch "
                     "(file content doesn't match bundle manifest)"
@@ -338,38 +412,46 @@ def verify_bundle(bundle_dir: str, data_dir: str = None):
         except Exception as e:
             result.add_inconclusive(f"Could not verify output snapshot seal: {e}")
     
+    # Seal failures make the provenance and data checks moot
+    if result.outcome == VerificationOutcome.FAIL:
+        return result
+    
     # === STEP 4: Verify provenance chain consistency ===
-    try:
-        with open(runrecord_file) as f:
-            rr_data = json.load(f)
-        
-        # Check input consistency
-        claimed_input = rr_data['provenance']['input_snapshot']
-        actual_input = components['input_snapshot']['content_hash']
-        
-        if claimed_input != actual_input:
-            result.add_error(
-                f"Provenance chain broken: RunRecord claims input {claimed_input[:16]}... "
-                f"but bundle has {actual_input[:16]}..."
-            )
-        
-        # Check output consistency if present
-        if 'output_snapshot' in components:
-            claimed_output = rr_data['provenance'].get('output_snapshot')
-            actual_output = components['output_snapshot']['content_hash']
+    if rr_data is None:
+        result.add_inconclusive("Could not verify provenance chain: RunRecord unavailable")
+    else:
+        try:
+            # Check input consistency
+            claimed_input = rr_data['provenance']['input_snapshot']
+            actual_input = components['input_snapshot']['content_hash']
             
-            if claimed_output != actual_output:
+            if not _digests_equal(claimed_input, actual_input):
                 result.add_error(
-                    f"Provenance chain broken: RunRecord claims output {claimed_output[:16] if claimed_output else 'None'}... "
-                    f"but bundle has {actual_output[:16]}..."
+                    f"Provenance chain broken: RunRecord claims input {claimed_input[:16]}... "
+                    f"but bundle has {actual_input[:16]}..."
                 )
+            
+            # Check output consistency if present
+            if output_component is not None:
+                claimed_output = rr_data['provenance'].get('output_snapshot')
+                actual_output = output_component['content_hash']
+                
+                if not _digests_equal(claimed_output, actual_output):
+                    result.add_error(
+                        f"Provenance chain broken: RunRecord claims output {claimed_output[:16] if claimed_output else 'None'}... "
+                        f"but bundle has {actual_output[:16]}..."
+                    )
+        
+        except Exception as e:
+            result.add_inconclusive(f"Could not verify provenance chain: {e}")
     
-    except Exception as e:
-        result.add_inconclusive(f"Could not verify provenance chain: {e}")
+    # Skip the data re-hash (the most expensive step) once anything failed
+    if result.outcome == VerificationOutcome.FAIL:
+        return result
     
     # === STEP 5: Optional data verification ===
     if data_dir:
-        data_result = verify_snapshot(str(snapshot_file), data_dir)
+        data_result = verify_snapshot(snapshot_file, data_dir)
         
         if data_result.outcome == VerificationOutcome.FAIL:
             for err in data_result.errors:
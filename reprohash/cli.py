@@ -1,113 +1,147 @@
 #!/usr/bin/env python3
 """
-Complete CLI update to add compare-environments command.
+ReproHash command-line interface.
 
-This is the exact code to add to your reprohash/cli.py file.
+Commands: snapshot, run, verify, verify-runrecord, verify-bundle,
+create-bundle, compare-environments.
 """
 
+import os
 import sys
 import argparse
 import json
-import subprocess # nosec
-import time
+import re
+import tempfile
 from pathlib import Path
 
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="ReproHash - Cryptographic Input State Verification",
-        epilog="Complete documentation: https://github.com/reprohash/reprohash-core"
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='Commands')
-    
-    # ============================================================
-    # Existing commands (snapshot, verify, run, etc.)
-    # ============================================================
-    
-    # Snapshot command
-    snapshot_parser = subparsers.add_parser('snapshot', help='Create snapshot')
-    snapshot_parser.add_argument('directory', help='Directory to snapshot')
-    snapshot_parser.add_argument('-o', '--output', required=True, help='Output file')
-    snapshot_parser.add_argument('--source', choices=['posix', 'container', 'drive'], 
-                                default='posix', help='Source type')
-    
-    # Run command
-    run_parser = subparsers.add_parser(
-        'run', 
-        help='Execute command and create sealed runrecord (prospective recording only)'
-    )
-    run_parser.add_argument('--input-hash', required=True, help='Input snapshot hash')
-    run_parser.add_argument('--exec', required=True, help='Shell command to execute')
-    run_parser.add_argument('-o', '--output', required=True, help='Output runrecord JSON file')
-    run_parser.add_argument(
+# Snapshots listing more files than this are streamed to disk.
+STREAM_JSON_FILES = 10_000
+
+# Write buffer for streamed JSON; json.dump emits many small chunks
+STREAM_BUFFER_SIZE = 1 << 20
+
+
+def _snapshot_arguments(parser):
+    parser.add_argument('directory', help='Directory to snapshot')
+    parser.add_argument('-o', '--output', required=True, help='Output file')
+    parser.add_argument('--source', choices=['posix', 'container', 'drive'], 
+                        default='posix', help='Source type')
+
+
+def _run_arguments(parser):
+    parser.add_argument('--input-hash', required=True, help='Input snapshot hash')
+    parser.add_argument('--exec', required=True, help='Shell command to execute')
+    parser.add_argument('-o', '--output', required=True, help='Output runrecord JSON file')
+    parser.add_argument(
         '--reproducibility-class',
         choices=['deterministic', 'stochastic', 'unknown'],
         default='unknown',
         help='Reproducibility class (default: unknown)'
     )
-    run_parser.add_argument(
+    parser.add_argument(
         '--env-plugin',
         action='append',
         help='Environment capture plugin (e.g., pip). Can be specified multiple times.'
     )
-    
-    # Verify snapshot command
-    verify_parser = subparsers.add_parser('verify', help='Verify snapshot')
-    verify_parser.add_argument('snapshot', help='Snapshot file')
-    verify_parser.add_argument('-d', '--directory', required=True, help='Data directory')
-    
-    # Verify runrecord command
-    verify_rr_parser = subparsers.add_parser('verify-runrecord', 
-                                             help='Verify runrecord seal')
-    verify_rr_parser.add_argument('runrecord', help='RunRecord file')
-    
-    # Verify bundle command
-    verify_bundle_parser = subparsers.add_parser('verify-bundle',
-                                                 help='Verify complete bundle')
-    verify_bundle_parser.add_argument('bundle_dir', help='Bundle directory')
-    verify_bundle_parser.add_argument('-d', '--data-dir', 
-                                     help='Data directory for snapshot verification (optional)')
-    
-    # Create bundle command
-    bundle_parser = subparsers.add_parser('create-bundle', 
-                                         help='Create complete verification bundle')
-    bundle_parser.add_argument('--input-snapshot', required=True, 
-                              help='Input snapshot JSON file')
-    bundle_parser.add_argument('--runrecord', required=True, 
-                              help='RunRecord JSON file')
-    bundle_parser.add_argument('--output-snapshot', 
-                              help='Output snapshot JSON file (optional)')
-    bundle_parser.add_argument('-o', '--output', required=True, 
-                              help='Output bundle directory')
-    
-    # ============================================================
-    # NEW: Compare environments command
-    # ============================================================
-    
-    compare_parser = subparsers.add_parser(
-        'compare-environments',
-        help='Compare environment metadata between two RunRecords'
-    )
-    compare_parser.add_argument(
+
+
+def _verify_arguments(parser):
+    parser.add_argument('snapshot', help='Snapshot file')
+    parser.add_argument('-d', '--directory', required=True, help='Data directory')
+
+
+def _verify_runrecord_arguments(parser):
+    parser.add_argument('runrecord', help='RunRecord file')
+
+
+def _verify_bundle_arguments(parser):
+    parser.add_argument('bundle_dir', help='Bundle directory')
+    parser.add_argument('-d', '--data-dir', 
+                        help='Data directory for snapshot verification (optional)')
+
+
+def _create_bundle_arguments(parser):
+    parser.add_argument('--input-snapshot', required=True, 
+                        help='Input snapshot JSON file')
+    parser.add_argument('--runrecord', required=True, 
+                        help='RunRecord JSON file')
+    parser.add_argument('--output-snapshot', 
+                        help='Output snapshot JSON file (optional)')
+    parser.add_argument('-o', '--output', required=True, 
+                        help='Output bundle directory')
+
+
+def _compare_environments_arguments(parser):
+    parser.add_argument(
         'runrecord1',
         help='First RunRecord JSON file'
     )
-    compare_parser.add_argument(
+    parser.add_argument(
         'runrecord2',
         help='Second RunRecord JSON file'
     )
-    compare_parser.add_argument(
+    parser.add_argument(
         '--json',
         action='store_true',
         help='Output in JSON format'
     )
+
+
+# Command name -> (help text, argument builder), in help order.
+COMMANDS = {
+    'snapshot': ('Create snapshot', _snapshot_arguments),
+    'run': ('Execute command and create sealed runrecord (prospective recording only)',
+            _run_arguments),
+    'verify': ('Verify snapshot', _verify_arguments),
+    'verify-runrecord': ('Verify runrecord seal', _verify_runrecord_arguments),
+    'verify-bundle': ('Verify complete bundle', _verify_bundle_arguments),
+    'create-bundle': ('Create complete verification bundle', _create_bundle_arguments),
+    'compare-environments': ('Compare environment metadata between two RunRecords',
+                             _compare_environments_arguments),
+}
+
+
+def _parse_args(argv):
+    """
+    Parse command-line arguments.
+    
+    A known command gets a parser holding only its own arguments. Anything
+    else (no command, -h, unknown command) goes through the full top-level
+    parser, which lists every command and reports usage errors.
+    """
+    prog = Path(sys.argv[0]).name
+    
+    if argv and argv[0] in COMMANDS:
+        command = argv[0]
+        parser = argparse.ArgumentParser(prog=f"{prog} {command}")
+        COMMANDS[command][1](parser)
+        args = parser.parse_args(argv[1:])
+        args.command = command
+        return args
+    
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="ReproHash - Cryptographic Input State Verification",
+        epilog="Complete documentation: https://github.com/reprohash/reprohash-core"
+    )
     
-    args = parser.parse_args()
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+    for command, (help_text, add_arguments) in COMMANDS.items():
+        add_arguments(subparsers.add_parser(command, help=help_text))
+    
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
+    return args
+
+
+def main():
+    """Main CLI entry point."""
+    args = _parse_args(sys.argv[1:])
+    
+    if not args.command:
         return
     
     # ============================================================
@@ -115,19 +149,20 @@ def main():
     # ============================================================
     
     if args.command == 'snapshot':
-        from reprohash import create_snapshot, SourceType
+        from reprohash.snapshot import create_snapshot, SourceType
         
-        source_type = SourceType[args.source.upper()]
+        source_type = SourceType(args.source)
         snapshot = create_snapshot(args.directory, source_type)
         
-        with open(args.output, 'w') as f:
-            json.dump(snapshot.to_dict(), f, indent=2)
+        _dump_json(args.output, snapshot.to_dict(),
+                   stream=len(snapshot.files) > STREAM_JSON_FILES)
         
         print(f" Snapshot created: {args.output}")
         print(f"  Content hash: {snapshot.content_hash}")
     
     elif args.command == 'run':
-        from reprohash import RunRecord, ReproducibilityClass
+        import time
+        from reprohash.runrecord import RunRecord, ReproducibilityClass
         
         print(f" Executing: {args.exec}")
         print(f"   Input hash: {args.input_hash[:16]}...")
@@ -138,7 +173,7 @@ def main():
         print()
         
         # Create runrecord with optional environment plugins
-        repro_class = ReproducibilityClass[args.reproducibility_class.upper()]
+        repro_class = ReproducibilityClass(args.reproducibility_class)
         
         runrecord = RunRecord(
             input_snapshot_hash=args.input_hash,
@@ -148,15 +183,17 @@ def main():
         )
         
         # Execute command
+        # Wall-clock start for the record; duration from the monotonic
+        # clock so clock adjustments during the run cannot skew it
         runrecord.started = time.time()
+        start_ns = time.monotonic_ns()
         try:
-            result = subprocess.run(args.exec, shell=True)
-            exit_code = result.returncode
+            exit_code = _execute(args.exec)
         except Exception as e:
             print(f" Execution failed: {e}")
             exit_code = 1
         
-        runrecord.ended = time.time()
+        runrecord.ended = runrecord.started + (time.monotonic_ns() - start_ns) / 1e9
         runrecord.exit_code = exit_code
         
         # Seal
@@ -165,8 +202,7 @@ def main():
         # Export to JSON
         runrecord_dict = runrecord.to_dict()
         
-        with open(args.output, 'w') as f:
-            json.dump(runrecord_dict, f, indent=2)
+        _dump_json(args.output, runrecord_dict)
         
         # Save environment data if captured
         if runrecord.env_metadata:
@@ -191,14 +227,14 @@ def main():
         sys.exit(exit_code)
     
     elif args.command == 'verify':
-        from reprohash import verify_snapshot
+        from reprohash.verify import verify_snapshot
         
         result = verify_snapshot(args.snapshot, args.directory)
         _print_result(result)
         sys.exit(0 if result.outcome.value == "PASS_INPUT_INTEGRITY" else 1)
     
     elif args.command == 'verify-runrecord':
-        from reprohash import verify_runrecord
+        from reprohash.verify import verify_runrecord
         
         result = verify_runrecord(args.runrecord)
         _print_result(result)
@@ -212,29 +248,34 @@ def main():
         sys.exit(0 if result.outcome.value == "PASS_INPUT_INTEGRITY" else 1)
     
     elif args.command == 'create-bundle':
-        from reprohash import Snapshot, RunRecord, SourceType
+        from reprohash.runrecord import RunRecord, ReproducibilityClass
         from reprohash.bundle import ZenodoBundle
-        
-        # Load input snapshot
-        with open(args.input_snapshot) as f:
-            input_snap_data = json.load(f)
-        
-        # Reconstruct Snapshot object
-        input_snapshot = Snapshot(SourceType.POSIX)
-        for file_info in input_snap_data['hashable_manifest']['files']:
-            input_snapshot.add_file(
-                file_info['path'],
-                file_info['sha256'],
-                file_info['size']
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Load the independent input files concurrently
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            input_future = pool.submit(_load_json, args.input_snapshot)
+            rr_future = pool.submit(_load_json, args.runrecord)
+            output_future = (
+                pool.submit(_load_json, args.output_snapshot)
+                if args.output_snapshot else None
             )
-        input_snapshot.finalize()
+            input_snap_data = input_future.result()
+            rr_data = rr_future.result()
+            output_snap_data = output_future.result() if output_future else None
         
-        # Load runrecord
-        with open(args.runrecord) as f:
-            rr_data = json.load(f)
+        # Rebuild snapshots from their exported manifests
+        try:
+            input_snapshot = _load_snapshot(input_snap_data)
+            output_snapshot = (
+                _load_snapshot(output_snap_data)
+                if output_snap_data is not None else None
+            )
+        except ValueError as e:
+            print(f" {e}")
+            sys.exit(1)
         
         # Reconstruct RunRecord object
-        from reprohash import ReproducibilityClass
         runrecord = RunRecord(
             rr_data['provenance']['input_snapshot'],
             rr_data['execution']['command'],
@@ -249,21 +290,6 @@ def main():
         if rr_data['provenance'].get('output_snapshot'):
             runrecord.output_snapshot_hash = rr_data['provenance']['output_snapshot']
         
-        # Load output snapshot if provided
-        output_snapshot = None
-        if args.output_snapshot:
-            with open(args.output_snapshot) as f:
-                output_snap_data = json.load(f)
-            
-            output_snapshot = Snapshot(SourceType.POSIX)
-            for file_info in output_snap_data['hashable_manifest']['files']:
-                output_snapshot.add_file(
-                    file_info['path'],
-                    file_info['sha256'],
-                    file_info['size']
-                )
-            output_snapshot.finalize()
-        
         # Create bundle
         bundle = ZenodoBundle(input_snapshot, runrecord, output_snapshot)
         bundle_hash = bundle.create_bundle(args.output)
@@ -272,24 +298,18 @@ def main():
         print(f"  Bundle hash: {bundle_hash}")
         print(f"  Verification: reprohash verify-bundle {args.output}")
     
-    # ============================================================
-    # NEW: Handle compare-environments command
-    # ============================================================
-    
     elif args.command == 'compare-environments':
         from reprohash.env_plugins import compare_environment_metadata
         
         # Load both RunRecords
         try:
-            with open(args.runrecord1) as f:
-                rr1 = json.load(f)
+            rr1 = _load_json(args.runrecord1)
         except Exception as e:
             print(f" Could not load {args.runrecord1}: {e}")
             sys.exit(1)
         
         try:
-            with open(args.runrecord2) as f:
-                rr2 = json.load(f)
+            rr2 = _load_json(args.runrecord2)
         except Exception as e:
             print(f" Could not load {args.runrecord2}: {e}")
             sys.exit(1)
@@ -302,118 +322,243 @@ def main():
             print(json.dumps(comparison, indent=2))
             sys.exit(0)
         
-        # Human-readable output
-        print("=" * 60)
-        print("Environment Comparison")
-        print("=" * 60)
+        # Human-readable output, written to stdout in one call
+        out = []
+        emit = out.append
+        
+        emit("=" * 60)
+        emit("Environment Comparison")
+        emit("=" * 60)
         
         if not comparison['comparable']:
-            print(f"\n {comparison['reason']}")
-            print("\nTo compare environments, both RunRecords must have")
-            print("been created with --env-plugin flag.")
-            print("\nExample:")
-            print("  reprohash run --env-plugin pip ... -o runrecord.json")
+            emit(f"\n {comparison['reason']}")
+            emit("\nTo compare environments, both RunRecords must have")
+            emit("been created with --env-plugin flag.")
+            emit("\nExample:")
+            emit("  reprohash run --env-plugin pip ... -o runrecord.json")
+            _write_lines(out)
             sys.exit(1)
         
-        print(f"\nRunRecord 1: {args.runrecord1}")
-        print(f"  Run ID: {rr1.get('run_id', 'unknown')[:16]}...")
-        print(f"  Environment fingerprint: {comparison['fingerprint_a']}")
+        emit(f"\nRunRecord 1: {args.runrecord1}")
+        emit(f"  Run ID: {rr1.get('run_id', 'unknown')[:16]}...")
+        emit(f"  Environment fingerprint: {comparison['fingerprint_a']}")
         
-        print(f"\nRunRecord 2: {args.runrecord2}")
-        print(f"  Run ID: {rr2.get('run_id', 'unknown')[:16]}...")
-        print(f"  Environment fingerprint: {comparison['fingerprint_b']}")
+        emit(f"\nRunRecord 2: {args.runrecord2}")
+        emit(f"  Run ID: {rr2.get('run_id', 'unknown')[:16]}...")
+        emit(f"  Environment fingerprint: {comparison['fingerprint_b']}")
         
-        print("\n" + "-" * 60)
+        emit("\n" + "-" * 60)
         
         if comparison['identical']:
-            print(" Environments are IDENTICAL")
-            print("\nBoth RunRecords used the same:")
+            emit(" Environments are IDENTICAL")
+            emit("\nBoth RunRecords used the same:")
             
             env1 = rr1.get('environment_metadata', {})
             summary = env1.get('summary', {})
             
             if 'python' in summary:
-                print(f"  • Python: {summary['python']}")
+                emit(f"  • Python: {summary['python']}")
             
             if 'key_packages' in summary:
-                print("  • Key packages:")
-                for pkg, ver in summary['key_packages'].items():
-                    print(f"      {pkg}: {ver}")
+                emit("  • Key packages:")
+                out.extend(
+                    f"      {pkg}: {ver}"
+                    for pkg, ver in summary['key_packages'].items()
+                )
             
+            _write_lines(out)
             sys.exit(0)
         else:
-            print(" Environments DIFFER")
-            print("\nDifferences detected:")
+            emit(" Environments DIFFER")
+            emit("\nDifferences detected:")
             
-            for diff in comparison.get('differences', []):
-                print(f"  • {diff}")
+            out.extend(f"  • {diff}" for diff in comparison.get('differences', []))
             
             # Impact analysis
-            print("\n" + "=" * 60)
-            print("Impact Analysis")
-            print("=" * 60)
+            emit("\n" + "=" * 60)
+            emit("Impact Analysis")
+            emit("=" * 60)
             
             diffs = comparison.get('differences', [])
             
-            critical = []
-            moderate = []
-            minor = []
-            
-            for diff in diffs:
-                lower_diff = diff.lower()
-                
-                # Check for critical differences
-                if 'numpy' in lower_diff:
-                    # Check for NumPy 1.x -> 2.x (ABI break)
-                    if '1.' in lower_diff and '2.' in lower_diff:
-                        critical.append(f"{diff} [ABI INCOMPATIBILITY LIKELY]")
-                    else:
-                        moderate.append(diff)
-                elif 'torch' in lower_diff:
-                    # Check for major version change
-                    parts = diff.split('vs')
-                    if len(parts) == 2:
-                        try:
-                            v1 = parts[0].split(':')[1].strip().split('.')[0]
-                            v2 = parts[1].strip().split('.')[0]
-                            if v1 != v2:
-                                critical.append(f"{diff} [MAJOR VERSION CHANGE]")
-                            else:
-                                moderate.append(diff)
-                        except:
-                            moderate.append(diff)
-                    else:
-                        moderate.append(diff)
-                elif 'python' in lower_diff:
-                    moderate.append(diff)
-                else:
-                    minor.append(diff)
+            critical, moderate, minor = _classify_differences(diffs)
             
             if critical:
-                print("\n🔴 CRITICAL differences (likely to affect results):")
-                for item in critical:
-                    print(f"   {item}")
+                emit("\n🔴 CRITICAL differences (likely to affect results):")
+                out.extend(f"   {item}" for item in critical)
             
             if moderate:
-                print("\n🟡 MODERATE differences (may affect results):")
-                for item in moderate:
-                    print(f"   {item}")
+                emit("\n🟡 MODERATE differences (may affect results):")
+                out.extend(f"   {item}" for item in moderate)
             
             if minor:
-                print("\n🟢 MINOR differences (unlikely to affect results):")
-                for item in minor:
-                    print(f"   {item}")
+                emit("\n🟢 MINOR differences (unlikely to affect results):")
+                out.extend(f"   {item}" for item in minor)
             
-            print("\n" + "=" * 60)
-            print("Note")
-            print("=" * 60)
-            print("Input integrity is verified separately.")
-            print("Environment differences are informational only.")
-            print("Re-execution is required to confirm reproducibility.")
+            emit("\n" + "=" * 60)
+            emit("Note")
+            emit("=" * 60)
+            emit("Input integrity is verified separately.")
+            emit("Environment differences are informational only.")
+            emit("Re-execution is required to confirm reproducibility.")
             
+            _write_lines(out)
             sys.exit(1)  # Exit with code 1 to indicate differences
 
 
+# Package families whose version differences matter for impact analysis.
+_IMPACT_RE = re.compile(r'numpy|torch|python', re.IGNORECASE)
+
+
+def _classify_differences(diffs):
+    """Split environment differences into critical, moderate and minor."""
+    critical = []
+    moderate = []
+    minor = []
+    
+    for diff in diffs:
+        families = {m.group().lower() for m in _IMPACT_RE.finditer(diff)}
+        
+        if 'numpy' in families:
+            # Check for NumPy 1.x -> 2.x (ABI break)
+            if '1.' in diff and '2.' in diff:
+                critical.append(f"{diff} [ABI INCOMPATIBILITY LIKELY]")
+            else:
+                moderate.append(diff)
+        elif 'torch' in families:
+            # Check for major version change
+            parts = diff.split('vs')
+            if len(parts) == 2:
+                try:
+                    v1 = parts[0].split(':')[1].strip().split('.')[0]
+                    v2 = parts[1].strip().split('.')[0]
+                    if v1 != v2:
+                        critical.append(f"{diff} [MAJOR VERSION CHANGE]")
+                    else:
+                        moderate.append(diff)
+                except IndexError:
+                    moderate.append(diff)
+            else:
+                moderate.append(diff)
+        elif 'python' in families:
+            moderate.append(diff)
+        else:
+            minor.append(diff)
+    
+    return critical, moderate, minor
+
+
+def _load_snapshot(data):
+    """
+    Rebuild an exported snapshot without re-sorting or rehashing its files.
+    
+    The stored content_hash is still checked against the manifest.
+    """
+    from reprohash.snapshot import Snapshot
+    
+    snapshot = Snapshot.from_hashable_manifest(
+        data['hashable_manifest'],
+        data['content_hash'],
+        created_at=data.get('created_at'),
+        annotations=data.get('annotations')
+    )
+    if not snapshot.verify_hash():
+        raise ValueError("Snapshot content_hash does not match its manifest")
+    return snapshot
+
+
+def _write_lines(lines):
+    """Write lines to stdout with a single call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _load_json(path):
+    """Parse a JSON file read with a single call."""
+    return json.loads(Path(path).read_bytes())
+
+
+def _write_file(fd, data):
+    """Write bytes to an open descriptor with raw os.write calls, no buffer layer."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _dump_json(path, obj, stream=False):
+    """
+    Write obj as indented JSON, replacing path atomically.
+    
+    The document is written to a uniquely named temporary file next to
+    path and renamed into place, so an interrupted write never leaves a
+    truncated file and concurrent writers never share a temporary file.
+    Normally it is encoded once and written with a single call. With
+    stream=True it is encoded incrementally through the file buffer, so a
+    huge manifest is never held as one indented string.
+    """
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp"
+    )
+    try:
+        if stream:
+            with open(fd, 'w', buffering=STREAM_BUFFER_SIZE) as f:
+                json.dump(obj, f, indent=2)
+        else:
+            try:
+                _write_file(fd, json.dumps(obj, indent=2).encode('utf-8'))
+            finally:
+                os.close(fd)
+        # mkstemp creates the file 0600; give it the usual umask permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# Characters that need /bin/sh to interpret the command line.
+_SHELL_METACHARACTERS = frozenset('|&;<>()$`\\"\'*?[]{}#~=%!\n')
+
+
+def _spawn(argv):
+    """Spawn argv (searching PATH), wait for it and return its exit code."""
+    pid = os.posix_spawnp(argv[0], argv, os.environ)
+    _, status = os.waitpid(pid, 0)
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _execute(command):
+    """
+    Execute a command and return its exit code.
+    
+    Plain commands (words separated by whitespace) are spawned directly,
+    saving the intermediate /bin/sh process. Anything using shell syntax,
+    or a program that cannot be spawned, is spawned as /bin/sh -c so exit
+    codes and error messages match a shell. Platforms without posix_spawn
+    use subprocess with shell=True.
+    """
+    if not hasattr(os, 'posix_spawnp'):
+        import subprocess # nosec
+        return subprocess.run(command, shell=True).returncode
+    
+    argv = command.split()
+    if argv and _SHELL_METACHARACTERS.isdisjoint(command):
+        try:
+            return _spawn(argv)
+        except OSError:
+            pass
+    
+    return _spawn(['/bin/sh', '-c', command])
+
+
 def _print_result(result):
     """Print verification result."""
     print(f"\n{'='*60}")
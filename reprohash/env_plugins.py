@@ -6,24 +6,40 @@ Complete standalone module for environment metadata capture.
 Can be imported without affecting existing reprohash functionality.
 """
 
+import os
 import sys
 import json
 import time
 import hashlib
+import functools
 import importlib.metadata
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
 VERSION = "2.1"
 ENV_SCHEMA_VERSION = "reprohash.env.v1"
 
+# Attached to every exported EnvironmentMetadata
+METADATA_NOTE = "Informational only. Not part of cryptographic verification."
+
+# Key packages for ML/scientific computing, shown in summaries
+KEY_PACKAGE_NAMES = frozenset({
+    "torch", "torchvision", "tensorflow",
+    "numpy", "scipy", "pandas", "scikit-learn",
+    "jax", "mxnet"
+})
+
+
+# Shared encoder, so fingerprinting does not build one per call
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
 
 def canonical_json(obj: Any) -> str:
     """Canonical JSON for deterministic hashing."""
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return _CANONICAL_ENCODER.encode(obj)
 
 
 # ============================================================
@@ -60,23 +76,31 @@ class EnvironmentPlugin(ABC):
         """
         raise NotImplementedError
     
-    def get_envelope(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_envelope(
+        self,
+        data: Dict[str, Any],
+        timestamp: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Wrap plugin data in standard envelope.
         
         Args:
             data: Plugin-specific metadata
+            timestamp: Capture time (default: now). Not hashed.
             
         Returns:
             Standardized envelope with metadata
         """
+        if timestamp is None:
+            timestamp = time.time()
+        
         return {
             "schema": self.SCHEMA_VERSION,
             "captured_by": {
                 "plugin": self.PLUGIN_NAME,
                 "plugin_version": self.PLUGIN_VERSION
             },
-            "timestamp": time.time(),
+            "timestamp": timestamp,
             "data": data
         }
     
@@ -99,9 +123,10 @@ class EnvironmentPlugin(ABC):
         }
     
     def capture_with_envelope(self) -> Dict[str, Any]:
-        """Capture and wrap in envelope."""
+        """Capture and wrap in envelope, stamped when capture starts."""
+        timestamp = time.time()
         data = self.capture()
-        return self.get_envelope(data)
+        return self.get_envelope(data, timestamp)
     
     def get_fingerprint_hash(self, envelope: Dict[str, Any]) -> str:
         """
@@ -124,6 +149,70 @@ class EnvironmentPlugin(ABC):
 # Reference Plugin: Python/pip
 # ============================================================
 
+# Metadata file stat()ed per distribution entry found on sys.path
+_DIST_METADATA_FILES = {".dist-info": "METADATA", ".egg-info": "PKG-INFO"}
+
+
+def _path_signature() -> Tuple[Tuple[str, int, int, int], ...]:
+    """
+    Identity of every distribution's metadata on sys.path.
+    
+    One (path, st_ino, st_size, st_mtime_ns) record per *.dist-info or
+    *.egg-info entry, taken from its metadata file. An install, removal
+    or in-place upgrade renames or rewrites that file, so the signature
+    changes even when the containing directory's mtime does not.
+    Non-directory entries (zip files) are recorded by their own stat.
+    """
+    suffixes = tuple(_DIST_METADATA_FILES)
+    signature = []
+    for entry in sys.path:
+        directory = entry or "."
+        try:
+            with os.scandir(directory) as it:
+                names = sorted(
+                    d.name for d in it
+                    if d.name.endswith(suffixes)
+                )
+        except NotADirectoryError:
+            names = [""]
+        except OSError:
+            continue
+        
+        for name in names:
+            path = os.path.join(directory, name) if name else directory
+            if name and os.path.isdir(path):
+                path = os.path.join(path, _DIST_METADATA_FILES[os.path.splitext(name)[1]])
+            try:
+                st = os.stat(path)
+            except OSError:
+                signature.append((path, -1, -1, -1))
+                continue
+            signature.append((path, st.st_ino, st.st_size, st.st_mtime_ns))
+    return tuple(signature)
+
+
+@functools.lru_cache(maxsize=4)
+def _collect_packages(path_signature: Tuple[Tuple[str, int, int, int], ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Scan installed distributions, sorted by name.
+    
+    Cached per _path_signature(), so repeated captures skip the scan
+    until some distribution's metadata has changed. Reads the Name field
+    from metadata directly; Distribution.name only exists on Python 3.10+.
+    """
+    # importlib.metadata (3.10+) caches directory listings keyed on the
+    # directory mtime, which an in-place upgrade need not change. On 3.11
+    # invalidate_caches is a plain method, so call it on an instance.
+    finder = importlib.metadata.MetadataPathFinder()
+    if hasattr(finder, 'invalidate_caches'):
+        finder.invalidate_caches()
+    packages = {
+        dist.metadata['Name']: dist.version
+        for dist in importlib.metadata.distributions()
+    }
+    return tuple(sorted(packages.items()))  # Deterministic ordering
+
+
 class PipEnvironmentPlugin(EnvironmentPlugin):
     """
     Captures Python and pip package environment.
@@ -154,18 +243,15 @@ class PipEnvironmentPlugin(EnvironmentPlugin):
         }
         
         # Get installed packages
-        packages = {}
         try:
-            # Use importlib.metadata (Python 3.8+)
-            for dist in importlib.metadata.distributions():
-                packages[dist.name] = dist.version
+            packages = dict(_collect_packages(_path_signature()))
         except Exception as e:
             # Fallback: note the error
-            packages["_error"] = f"Could not enumerate packages: {str(e)}"
+            packages = {"_error": f"Could not enumerate packages: {str(e)}"}
         
         return {
             "python": python_info,
-            "packages": dict(sorted(packages.items())),  # Deterministic ordering
+            "packages": packages,
             "capture_method": "importlib.metadata"
         }
     
@@ -181,17 +267,10 @@ class PipEnvironmentPlugin(EnvironmentPlugin):
         """
         packages = data.get("packages", {})
         
-        # Key packages for ML/scientific computing
-        key_package_names = [
-            "torch", "torchvision", "tensorflow", 
-            "numpy", "scipy", "pandas", "scikit-learn",
-            "jax", "mxnet"
-        ]
-        
         key_packages = {
             name: version 
             for name, version in packages.items() 
-            if name.lower() in key_package_names
+            if name.lower() in KEY_PACKAGE_NAMES
         }
         
         return {
@@ -209,12 +288,14 @@ class PluginRegistry:
     """Registry of available environment plugins."""
     
     _plugins: Dict[str, type] = {}
+    _instances: Dict[str, EnvironmentPlugin] = {}
     
     @classmethod
     def register(cls, plugin_class: type):
         """Register a plugin."""
         plugin_name = plugin_class.PLUGIN_NAME
         cls._plugins[plugin_name] = plugin_class
+        cls._instances.pop(plugin_name, None)
         return plugin_class
     
     @classmethod
@@ -222,6 +303,22 @@ class PluginRegistry:
         """Get plugin class by name."""
         return cls._plugins.get(plugin_name)
     
+    @classmethod
+    def get_instance(cls, plugin_name: str) -> Optional[EnvironmentPlugin]:
+        """
+        Get a shared plugin instance by name.
+        
+        Plugins hold no per-capture state, so one instance per plugin is
+        reused for every capture and verification.
+        """
+        plugin = cls._instances.get(plugin_name)
+        if plugin is None:
+            plugin_class = cls._plugins.get(plugin_name)
+            if plugin_class is None:
+                return None
+            plugin = cls._instances[plugin_name] = plugin_class()
+        return plugin
+    
     @classmethod
     def list_plugins(cls) -> List[str]:
         """List available plugin names."""
@@ -236,7 +333,11 @@ PluginRegistry.register(PipEnvironmentPlugin)
 # Environment Metadata Container
 # ============================================================
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class EnvironmentMetadata:
     """
     Container for environment metadata attached to RunRecords.
@@ -250,6 +351,9 @@ class EnvironmentMetadata:
     schema_version: str
     summary: Dict[str, Any]
     full_data_file: Optional[str] = None  # Path to full JSON in bundle
+    _full_envelope: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Full plugin output, saved to the bundle; never exported
     
     def to_dict(self) -> Dict[str, Any]:
         """Export for RunRecord."""
@@ -260,7 +364,7 @@ class EnvironmentMetadata:
             "plugin_version": self.plugin_version,
             "summary": self.summary,
             "full_data_file": self.full_data_file,
-            "note": "Informational only. Not part of cryptographic verification."
+            "note": METADATA_NOTE
         }
     
     @classmethod
@@ -317,18 +421,15 @@ class EnvironmentCapture:
         
         plugin_name = plugin_names[0]
         
-        # Get plugin class
-        plugin_class = PluginRegistry.get(plugin_name)
-        if not plugin_class:
+        # Get plugin
+        plugin = PluginRegistry.get_instance(plugin_name)
+        if plugin is None:
             available = PluginRegistry.list_plugins()
             raise ValueError(
                 f"Unknown plugin: {plugin_name}. "
                 f"Available: {', '.join(available)}"
             )
         
-        # Instantiate and capture
-        plugin = plugin_class()
-        
         try:
             envelope = plugin.capture_with_envelope()
             fingerprint_hash = plugin.get_fingerprint_hash(envelope)
@@ -368,13 +469,14 @@ class EnvironmentCapture:
             metadata: Environment metadata with full envelope
             output_dir: Bundle directory
         """
-        if not hasattr(metadata, '_full_envelope'):
+        if metadata._full_envelope is None:
             return
         
         env_file = output_dir / f"environment_{metadata.plugin_name}.json"
         
-        with open(env_file, 'w') as f:
-            json.dump(metadata._full_envelope, f, indent=2)
+        env_file.write_bytes(
+            json.dumps(metadata._full_envelope, indent=2).encode('utf-8')
+        )
         
         metadata.full_data_file = env_file.name
 
@@ -456,13 +558,11 @@ def verify_environment_metadata(
             return result
         
         try:
-            with open(full_file) as f:
-                full_envelope = json.load(f)
+            full_envelope = json.loads(full_file.read_bytes())
             
             # Recompute hash
-            plugin_class = PluginRegistry.get(env_meta["captured_by"])
-            if plugin_class:
-                plugin = plugin_class()
+            plugin = PluginRegistry.get_instance(env_meta["captured_by"])
+            if plugin is not None:
                 recomputed_hash = plugin.get_fingerprint_hash(full_envelope)
                 
                 if recomputed_hash != env_meta["fingerprint_hash"]:
@@ -531,12 +631,17 @@ def compare_environment_metadata(
         pkg_a = summary_a.get("key_packages", {})
         pkg_b = summary_b.get("key_packages", {})
         
-        all_packages = set(pkg_a.keys()) | set(pkg_b.keys())
-        for pkg in all_packages:
+        # Version changes, then packages present on one side only
+        changed = [
+            pkg for pkg in pkg_a.keys() & pkg_b.keys()
+            if pkg_a[pkg] != pkg_b[pkg]
+        ]
+        changed.extend(pkg_a.keys() ^ pkg_b.keys())
+        
+        for pkg in sorted(changed):
             ver_a = pkg_a.get(pkg, "not installed")
             ver_b = pkg_b.get(pkg, "not installed")
-            if ver_a != ver_b:
-                differences.append(f"{pkg}: {ver_a} vs {ver_b}")
+            differences.append(f"{pkg}: {ver_a} vs {ver_b}")
         
         result["differences"] = differences
     
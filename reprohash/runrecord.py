@@ -17,22 +17,45 @@ import time
 import uuid
 import platform
 import hashlib
-from typing import Dict, Any, Optional, List
+import functools
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 from pathlib import Path
-from reprohash.env_plugins import (
-    EnvironmentCapture,
-    EnvironmentMetadata,
-    update_runrecord_with_environment
-)
 from enum import Enum
 
+if TYPE_CHECKING:
+    from reprohash.env_plugins import EnvironmentMetadata
+
 
 VERSION = "2.1"
 
+# Seal and verify_seal both encode through this single instance
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
 
 def canonical_json(obj: Any) -> str:
     """Canonical JSON for deterministic hashing."""
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return _CANONICAL_ENCODER.encode(obj)
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> Tuple[str, str]:
+    """
+    Python version and platform string, looked up once per process.
+    
+    platform.platform() runs uname and parses os-release on every call.
+    """
+    return platform.python_version(), platform.platform()
+
+
+@functools.lru_cache(maxsize=256)
+def _utc_iso(timestamp: float) -> str:
+    """
+    Format a Unix timestamp as ISO 8601 UTC, to the second.
+    
+    Keyed on the timestamp itself rather than stored at seal time, so the
+    string always matches the (possibly modified) raw value.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
 
 
 class ReproducibilityClass(Enum):
@@ -80,8 +103,10 @@ class RunRecord:
         
         # Seal hash - MUST be set via seal() before archival
         self.runrecord_hash = None
-        self.env_metadata: Optional[EnvironmentMetadata] = None
+        self.env_metadata: Optional['EnvironmentMetadata'] = None
         if env_plugins:
+            # Plugins (and importlib.metadata) load only when requested
+            from reprohash.env_plugins import EnvironmentCapture
             try:
                 self.env_metadata = EnvironmentCapture.capture_environment(env_plugins)
                 if self.env_metadata:
@@ -92,9 +117,10 @@ class RunRecord:
 
     def _capture_minimal_environment(self) -> Dict[str, Any]:
         """Minimal, reliable environment capture."""
+        python_version, platform_name = _platform_info()
         return {
-            "python_version": platform.python_version(),
-            "platform": platform.platform(),
+            "python_version": python_version,
+            "platform": platform_name,
             "note": "Minimal environment. Host details affect reproducibility but are not controlled."
         }
     
@@ -109,6 +135,28 @@ class RunRecord:
         
         self.output_snapshot_hash = output_snapshot_hash
     
+    def _compute_hash(self) -> str:
+        """
+        Hash the sealed fields as they are now.
+        
+        Always recomputed from current attributes: reusing bytes from
+        seal() would let verify_seal() miss later modifications.
+        """
+        record = {
+            "run_id": self.run_id,
+            "input_snapshot_hash": self.input_snapshot_hash,
+            "output_snapshot_hash": self.output_snapshot_hash,
+            "command": self.command,
+            "reproducibility_class": self.reproducibility_class.value,
+            "exit_code": self.exit_code,
+            "started": self.started,
+            "ended": self.ended,
+            "environment": self.environment
+        }
+        return hashlib.sha256(
+            canonical_json(record).encode('utf-8')
+        ).hexdigest()
+    
     def seal(self) -> str:
         """
         Cryptographically seal the runrecord.
@@ -126,21 +174,7 @@ class RunRecord:
         if self.runrecord_hash:
             raise RuntimeError("RunRecord already sealed")
         
-        record = {
-            "run_id": self.run_id,
-            "input_snapshot_hash": self.input_snapshot_hash,
-            "output_snapshot_hash": self.output_snapshot_hash,
-            "command": self.command,
-            "reproducibility_class": self.reproducibility_class.value,
-            "exit_code": self.exit_code,
-            "started": self.started,
-            "ended": self.ended,
-            "environment": self.environment
-        }
-        
-        self.runrecord_hash = hashlib.sha256(
-            canonical_json(record).encode('utf-8')
-        ).hexdigest()
+        self.runrecord_hash = self._compute_hash()
         
         return self.runrecord_hash
     
@@ -149,23 +183,7 @@ class RunRecord:
         if not self.runrecord_hash:
             return False
         
-        record = {
-            "run_id": self.run_id,
-            "input_snapshot_hash": self.input_snapshot_hash,
-            "output_snapshot_hash": self.output_snapshot_hash,
-            "command": self.command,
-            "reproducibility_class": self.reproducibility_class.value,
-            "exit_code": self.exit_code,
-            "started": self.started,
-            "ended": self.ended,
-            "environment": self.environment
-        }
-        
-        computed = hashlib.sha256(
-            canonical_json(record).encode('utf-8')
-        ).hexdigest()
-        
-        return computed == self.runrecord_hash
+        return self._compute_hash() == self.runrecord_hash
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -198,8 +216,8 @@ class RunRecord:
             "execution": {
                 "command": self.command,
                 "exit_code": self.exit_code,
-                "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started)) if self.started else None,
-                "ended_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.ended)) if self.ended else None,
+                "started_at": _utc_iso(self.started) if self.started else None,
+                "ended_at": _utc_iso(self.ended) if self.ended else None,
                 "duration_seconds": round(self.ended - self.started, 2) if self.started and self.ended else None,
                 # FIX: Store raw timestamps for verification
                 "started_timestamp": self.started,
@@ -224,6 +242,7 @@ class RunRecord:
             }
         }
         if self.env_metadata:
+            from reprohash.env_plugins import update_runrecord_with_environment
             base_dict = update_runrecord_with_environment(base_dict, self.env_metadata)
 
         return base_dict
@@ -5,17 +5,32 @@ Snapshot with mechanically enforced hash scope.
 Hash scope is structurally guaranteed via HashableManifest dataclass.
 """
 
+import os
 import json
+import mmap
 import hashlib
-import copy
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
 
 VERSION = "2.1"
 
+# Read size for streaming file hashes (bounded memory, large hashlib updates)
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed from a read-only memory map
+MMAP_THRESHOLD = 16 << 20
+
+# File entries canonicalized per hasher update when hashing a manifest
+MANIFEST_HASH_BATCH = 4096
+
+
+# Reused for every manifest hash instead of a fresh encoder per call
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
 
 class SourceType(Enum):
     """Where files came from."""
@@ -34,7 +49,7 @@ def canonical_json(obj: Any) -> str:
     - Separators: ',' between items, ':' between key-value
     - UTF-8 encoding
     """
-    return json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return _CANONICAL_ENCODER.encode(obj)
 
 
 @dataclass
@@ -65,9 +80,22 @@ class HashableManifest:
         - created_at
         - any future metadata
         """
-        manifest_dict = self.to_hashable_dict()
-        canonical = canonical_json(manifest_dict)
-        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+        # Stream the exact canonical_json bytes into the hasher, a batch of
+        # entries at a time, so the full document is never materialized.
+        # Sorted key order is "files", "source_type", "version". Any
+        # sequence of entries encodes as a JSON array, so slice a list.
+        files = list(self.files)
+        h = hashlib.sha256(b'{"files":[')
+        for start in range(0, len(files), MANIFEST_HASH_BATCH):
+            if start:
+                h.update(b',')
+            batch = canonical_json(files[start:start + MANIFEST_HASH_BATCH])
+            h.update(batch[1:-1].encode('utf-8'))
+        h.update((
+            '],"source_type":' + canonical_json(self.source_type) +
+            ',"version":' + canonical_json(self.version) + '}'
+        ).encode('utf-8'))
+        return h.hexdigest()
 
 
 class Snapshot:
@@ -78,7 +106,7 @@ class Snapshot:
     1. HashableManifest contains ONLY hashed fields
     2. Annotations stored separately
     3. Files sorted canonically before hashing
-    4. Manifest deep-copied to prevent mutation
+    4. Manifest entries copied to prevent mutation
     """
     
     def __init__(self, source_type: SourceType):
@@ -90,6 +118,40 @@ class Snapshot:
         self._hashable_manifest: Optional[HashableManifest] = None
         self._content_hash: Optional[str] = None
     
+    @classmethod
+    def from_hashable_manifest(
+        cls,
+        manifest: Dict[str, Any],
+        content_hash: str,
+        created_at: Optional[float] = None,
+        annotations: Optional[Dict[str, Any]] = None
+    ) -> 'Snapshot':
+        """
+        Rebuild a finalized snapshot from an exported hashable manifest.
+        
+        Files are taken as already canonically sorted and content_hash is
+        attached as stored, without re-sorting or rehashing. Call
+        verify_hash() to check it against the manifest. As in finalize(),
+        the entries are copied (once, shared by Snapshot.files and the
+        sealed manifest), so later changes to the caller's data cannot
+        alter the snapshot.
+        """
+        files = [dict(f) for f in manifest["files"]]
+        
+        snapshot = cls(SourceType(manifest["source_type"]))
+        snapshot.files = files
+        snapshot.created_at = created_at
+        snapshot.annotations = dict(annotations or {})
+        
+        snapshot._hashable_manifest = HashableManifest(
+            version=manifest["version"],
+            source_type=manifest["source_type"],
+            files=files
+        )
+        snapshot._content_hash = content_hash
+        
+        return snapshot
+    
     def add_file(self, path: str, sha256: str, size: int):
         """Add file to snapshot."""
         if self._content_hash:
@@ -104,23 +166,37 @@ class Snapshot:
             "size": size
         })
     
+    def add_files(self, records: Iterable[Tuple[str, str, int]]):
+        """Add files to snapshot from (path, sha256, size) records."""
+        if self._content_hash:
+            raise RuntimeError(
+                "Cannot modify snapshot after finalization.\n"
+                "REASON: Hash is already computed and immutable."
+            )
+        
+        self.files.extend(
+            {"path": path, "sha256": sha256, "size": size}
+            for path, sha256, size in records
+        )
+    
     def finalize(self) -> str:
         """
         Compute content_hash from ONLY the hashable manifest.
         
         Enforcement:
         1. Files sorted canonically (deterministic ordering)
-        2. Manifest deep-copied (prevents mutation)
+        2. Manifest entries copied (prevents mutation)
         3. Hash computed from manifest only (excludes annotations)
         """
         if self._content_hash:
             raise RuntimeError("Snapshot already finalized")
         
         # Sort files canonically (UTF-8 bytewise comparison)
-        sorted_files = sorted(self.files, key=lambda f: f["path"])
+        sorted_files = sorted(self.files, key=itemgetter("path"))
         
-        # Deep copy to prevent mutation
-        immutable_files = copy.deepcopy(sorted_files)
+        # Copy to prevent mutation (entries hold only str/int values,
+        # so copying each dict is as isolating as a deepcopy)
+        immutable_files = [dict(f) for f in sorted_files]
         
         # Create hashable manifest
         self._hashable_manifest = HashableManifest(
@@ -184,6 +260,60 @@ class Snapshot:
         return recomputed == self._content_hash
 
 
+def _hash_file(path) -> Tuple[str, int]:
+    """
+    Stream a file through SHA-256. Returns (hexdigest, size).
+    
+    The size comes from fstat, so the data is never counted in Python.
+    Large files are hashed straight from the page cache via mmap
+    (with sequential read-ahead advice where supported);
+    otherwise hashlib.file_digest (Python 3.11+) runs the read loop in C.
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    # Single front-to-back pass: let the kernel read ahead
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mm).hexdigest(), size
+        
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest(), size
+        
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+        return h.hexdigest(), size
+
+
+def _iter_files(directory: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (relative_path, full_path) for every file under directory.
+    
+    Same selection as Path.rglob("*") + is_file(): symlinked files are
+    included, symlinked directories are not descended into. DirEntry
+    type checks come from the directory listing, so regular entries
+    need no extra stat() call. Directories that cannot be listed are
+    skipped, as rglob does; a missing or non-directory root yields
+    nothing.
+    """
+    pending = [("", os.fspath(directory))]
+    while pending:
+        prefix, current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                relative = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((relative + os.sep, entry.path))
+                elif entry.is_file():
+                    yield relative, entry.path
+
+
 def create_snapshot(directory: str, source_type: SourceType = SourceType.POSIX) -> Snapshot:
     """Create snapshot with strict hash scope enforcement."""
     import time
@@ -191,15 +321,16 @@ def create_snapshot(directory: str, source_type: SourceType = SourceType.POSIX)
     snapshot = Snapshot(source_type)
     snapshot.created_at = time.time()
     
-    # Add files
-    for path in Path(directory).rglob("*"):
-        if path.is_file():
-            with open(path, "rb") as f:
-                content = f.read()
-                sha256 = hashlib.sha256(content).hexdigest()
-            
-            rel_path = str(path.relative_to(directory))
-            snapshot.add_file(rel_path, sha256, len(content))
+    entries = list(_iter_files(directory))
+    
+    # Hash files concurrently (file reads and hashlib release the GIL)
+    workers = max(1, min(len(entries), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(_hash_file, [path for _, path in entries])
+        snapshot.add_files(
+            (relative, sha256, size)
+            for (relative, _), (sha256, size) in zip(entries, digests)
+        )
     
     # Finalize before annotations
     snapshot.finalize()
@@ -8,12 +8,17 @@ Three outcomes:
 - INCONCLUSIVE: Could not complete verification
 """
 
+import os
 import json
+import stat
 import hashlib
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+from .snapshot import _hash_file, _iter_files
+
 
 VERSION = "2.1"
 
@@ -72,6 +77,56 @@ class VerificationResult:
         }
 
 
+def _check_file(
+    file_path: str,
+    full_path: str,
+    file_info: Dict[str, Any]
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Check one manifest entry against disk.
+    
+    Returns (error, inconclusive_reason); at most one is set.
+    """
+    try:
+        # Follows symlinks, like Path.exists(); a size mismatch already
+        # proves the content changed
+        st = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return f"File MISSING (integrity violation): {file_path}", None
+    except PermissionError:
+        return None, f"Permission denied reading {file_path}"
+    except Exception as e:
+        return None, f"Could not read file {file_path}: {e}"
+    
+    # A directory (or other non-file) cannot be read, as open() would report
+    if not stat.S_ISREG(st.st_mode):
+        return None, f"Could not read file {file_path}: not a regular file"
+    actual_size = st.st_size
+    
+    try:
+        if actual_size != file_info.get('size', actual_size):
+            return (
+                f"File CHANGED (size differs): {file_path} "
+                f"(expected: {file_info['size']} bytes, "
+                f"got: {actual_size} bytes)"
+            ), None
+        
+        actual_hash, _ = _hash_file(full_path)
+        
+        if actual_hash != file_info['sha256']:
+            return (
+                f"File CHANGED (integrity violation): {file_path} "
+                f"(expected: {file_info['sha256'][:16]}..., "
+                f"got: {actual_hash[:16]}...)"
+            ), None
+    except PermissionError:
+        return None, f"Permission denied reading {file_path}"
+    except Exception as e:
+        return None, f"Could not read file {file_path}: {e}"
+    
+    return None, None
+
+
 def verify_snapshot(snapshot_file: str, data_dir: str) -> VerificationResult:
     """
     Verify snapshot against data directory.
@@ -85,8 +140,8 @@ def verify_snapshot(snapshot_file: str, data_dir: str) -> VerificationResult:
     
     # Load snapshot
     try:
-        with open(snapshot_file, 'r') as f:
-            snapshot = json.load(f)
+        # One bytes read; json detects the encoding without a text wrapper
+        snapshot = json.loads(Path(snapshot_file).read_bytes())
     except FileNotFoundError:
         result.add_inconclusive(
             f"Snapshot file not found: {snapshot_file} "
@@ -144,39 +199,26 @@ def verify_snapshot(snapshot_file: str, data_dir: str) -> VerificationResult:
     
     manifest_files = {f['path']: f for f in manifest.get('files', [])}
     
-    # Check all manifest files
-    for file_path, file_info in manifest_files.items():
-        full_path = data_path / file_path
-        
-        if not full_path.exists():
-            result.add_error(f"File MISSING (integrity violation): {file_path}")
-            continue
-        
-        try:
-            with open(full_path, 'rb') as f:
-                content = f.read()
-                actual_hash = hashlib.sha256(content).hexdigest()
-            
-            if actual_hash != file_info['sha256']:
-                result.add_error(
-                    f"File CHANGED (integrity violation): {file_path} "
-                    f"(expected: {file_info['sha256'][:16]}..., "
-                    f"got: {actual_hash[:16]}...)"
-                )
-        except PermissionError:
-            result.add_inconclusive(
-                f"Permission denied reading {file_path}"
-            )
-        except Exception as e:
-            result.add_inconclusive(f"Could not read file {file_path}: {e}")
+    # Check all manifest files concurrently (hashing releases the GIL);
+    # results come back in manifest order. Each entry is looked up by
+    # path, so files reached through symlinked directories still count.
+    workers = max(1, min(len(manifest_files), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        checks = executor.map(
+            lambda item: _check_file(
+                item[0], os.path.join(data_dir, item[0]), item[1]
+            ),
+            manifest_files.items()
+        )
+        for error, inconclusive in checks:
+            if error:
+                result.add_error(error)
+            if inconclusive:
+                result.add_inconclusive(inconclusive)
     
     # Extra files are warnings only
-    actual_files = set()
-    for path in data_path.rglob("*"):
-        if path.is_file():
-            actual_files.add(str(path.relative_to(data_path)))
-    
-    extra_files = actual_files - set(manifest_files.keys())
+    actual_files = {relative for relative, _ in _iter_files(data_dir)}
+    extra_files = actual_files - manifest_files.keys()
     if extra_files:
         result.add_warning(
             f"Found {len(extra_files)} files not in snapshot"
@@ -196,27 +238,50 @@ def verify_runrecord(runrecord_file: str) -> VerificationResult:
     """
     result = VerificationResult(VerificationOutcome.PASS_INPUT_INTEGRITY)
     
-    # Load runrecord
+    runrecord = _load_runrecord(runrecord_file, result)
+    if runrecord is None:
+        return result
+    
+    return _verify_runrecord_data(runrecord, result)
+
+
+def _load_runrecord(
+    runrecord_file: str,
+    result: VerificationResult,
+    content: Optional[bytes] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Load runrecord JSON, recording load failures on result.
+    
+    If content is given (file bytes already read by the caller), it is
+    parsed instead of reading runrecord_file.
+    
+    Returns None if the runrecord could not be loaded.
+    """
     try:
-        with open(runrecord_file, 'r') as f:
-            runrecord = json.load(f)
+        if content is None:
+            content = Path(runrecord_file).read_bytes()
+        return json.loads(content)
     except FileNotFoundError:
         result.add_inconclusive(
             f"RunRecord file not found: {runrecord_file}"
         )
-        return result
     except json.JSONDecodeError as e:
         result.add_error(f"RunRecord file corrupted (invalid JSON): {e}")
-        return result
     except PermissionError:
         result.add_inconclusive(
             f"Permission denied reading runrecord: {runrecord_file}"
         )
-        return result
     except Exception as e:
         result.add_inconclusive(f"Could not read RunRecord file: {e}")
-        return result
-    
+    return None
+
+
+def _verify_runrecord_data(
+    runrecord: Dict[str, Any],
+    result: VerificationResult
+) -> VerificationResult:
+    """Verify seal integrity of an already-loaded runrecord."""
     # Verify seal exists
     if 'runrecord_hash' not in runrecord:
         result.add_error("RunRecord missing seal")
@@ -31,3 +31,9 @@ def sample_files(tmp_workspace):
     (tmp_workspace / "data" / "file2.txt").write_text("content2")
     (tmp_workspace / "data" / "file3.txt").write_text("content3")
     return tmp_workspace / "data"
+
+
+@pytest.fixture
+def run_times():
+    """Fixed (started, ended) timestamps, so sealed records are deterministic."""
+    return 1234567890.0, 1234567900.0
@@ -7,21 +7,19 @@ Tests bundle-level sealing and complete verification.
 
 import pytest
 import json
-import time
 
 
 class TestBundleSealing:
     """Test bundle-level sealing."""
     
-    def test_bundle_has_seal(self, tmp_workspace, sample_file):
+    def test_bundle_has_seal(self, tmp_workspace, sample_file, run_times):
         """Bundle must have cryptographic seal."""
         from reprohash import create_snapshot, RunRecord, ZenodoBundle
         
         snapshot = create_snapshot(str(sample_file.parent))
         
         runrecord = RunRecord(snapshot.content_hash, "python test.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 1
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         runrecord.seal()
         
@@ -41,15 +39,14 @@ class TestBundleSealing:
         assert 'bundle_hash' in manifest
         assert manifest['bundle_hash'] == bundle_hash
     
-    def test_bundle_seal_binds_components(self, tmp_workspace, sample_file):
+    def test_bundle_seal_binds_components(self, tmp_workspace, sample_file, run_times):
         """Bundle seal must bind all component hashes."""
         from reprohash import create_snapshot, RunRecord, ZenodoBundle
         
         snapshot = create_snapshot(str(sample_file.parent))
         
         runrecord = RunRecord(snapshot.content_hash, "python test.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 1
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         runrecord.seal()
         
@@ -66,15 +63,14 @@ class TestBundleSealing:
         assert manifest['components']['input_snapshot']['content_hash'] == snapshot.content_hash
         assert manifest['components']['runrecord']['runrecord_hash'] == runrecord.runrecord_hash
     
-    def test_bundle_has_verification_profile(self, tmp_workspace, sample_file):
+    def test_bundle_has_verification_profile(self, tmp_workspace, sample_file, run_times):
         """Bundle must include verification_profile."""
         from reprohash import create_snapshot, RunRecord, ZenodoBundle
         
         snapshot = create_snapshot(str(sample_file.parent))
         
         runrecord = RunRecord(snapshot.content_hash, "python test.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 1
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         runrecord.seal()
         
@@ -91,7 +87,7 @@ class TestBundleSealing:
         assert 'id' in manifest['verification_profile']
         assert manifest['verification_profile']['id'] == 'reprohash-v2.1-strict'
     
-    def test_bundle_verification_detects_component_modification(self, tmp_workspace, sample_file):
+    def test_bundle_verification_detects_component_modification(self, tmp_workspace, sample_file, run_times):
         """Bundle verification must detect modified components."""
         from reprohash import create_snapshot, RunRecord, ZenodoBundle
         from reprohash.bundle import verify_bundle
@@ -99,8 +95,7 @@ class TestBundleSealing:
         snapshot = create_snapshot(str(sample_file.parent))
         
         runrecord = RunRecord(snapshot.content_hash, "python test.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 1
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         runrecord.seal()
         
@@ -124,7 +119,7 @@ class TestBundleSealing:
         assert result.outcome.value == "FAIL"
         assert any("modified" in err.lower() for err in result.errors)
     
-    def test_bundle_verification_pass_when_intact(self, tmp_workspace, sample_file):
+    def test_bundle_verification_pass_when_intact(self, tmp_workspace, sample_file, run_times):
         """Bundle verification must PASS when intact."""
         from reprohash import create_snapshot, RunRecord, ZenodoBundle
         from reprohash.bundle import verify_bundle
@@ -132,8 +127,7 @@ class TestBundleSealing:
         snapshot = create_snapshot(str(sample_file.parent))
         
         runrecord = RunRecord(snapshot.content_hash, "python test.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 1
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         runrecord.seal()
         
@@ -147,7 +141,7 @@ class TestBundleSealing:
         assert result.outcome.value == "PASS_INPUT_INTEGRITY"
         assert len(result.errors) == 0
     
-    def test_bundle_verification_checks_provenance_chain(self, tmp_workspace, sample_file):
+    def test_bundle_verification_checks_provenance_chain(self, tmp_workspace, sample_file, run_times):
         """Bundle verification must check provenance chain consistency."""
         from reprohash import create_snapshot, RunRecord, ZenodoBundle
         from reprohash.bundle import verify_bundle
@@ -155,8 +149,7 @@ class TestBundleSealing:
         snapshot = create_snapshot(str(sample_file.parent))
         
         runrecord = RunRecord(snapshot.content_hash, "python test.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 1
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         runrecord.bind_output("output_hash_123")
         runrecord.seal()
@@ -182,3 +175,133 @@ class TestBundleSealing:
         assert result.outcome.value == "FAIL"
         # Note: This will fail file integrity check first,
         # but that's correct - the runrecord file was modified
+    
+    def test_component_file_hashes_match_disk(self, tmp_workspace, sample_file, run_times):
+        """Recorded file_sha256 must match the bytes actually written."""
+        import hashlib
+        from reprohash import create_snapshot, RunRecord, ZenodoBundle
+        
+        snapshot = create_snapshot(str(sample_file.parent))
+        
+        runrecord = RunRecord(snapshot.content_hash, "python test.py")
+        runrecord.started, runrecord.ended = run_times
+        runrecord.exit_code = 0
+        runrecord.seal()
+        
+        bundle = ZenodoBundle(snapshot, runrecord)
+        bundle_dir = tmp_workspace / "bundle"
+        bundle.create_bundle(str(bundle_dir))
+        
+        with open(bundle_dir / "MANIFEST.json") as f:
+            manifest = json.load(f)
+        
+        for comp in manifest['components'].values():
+            on_disk = hashlib.sha256((bundle_dir / comp['file']).read_bytes()).hexdigest()
+            assert on_disk == comp['file_sha256']
+    
+    def test_bundle_with_output_snapshot_passes(self, tmp_workspace, sample_files, run_times):
+        """Bundle with an output snapshot must PASS when intact."""
+        from reprohash import create_snapshot, RunRecord, ZenodoBundle
+        from reprohash.bundle import verify_bundle
+        
+        input_snapshot = create_snapshot(str(sample_files))
+        output_dir = tmp_workspace / "out"
+        output_dir.mkdir()
+        (output_dir / "result.txt").write_text("result")
+        output_snapshot = create_snapshot(str(output_dir))
+        
+        runrecord = RunRecord(input_snapshot.content_hash, "python test.py")
+        runrecord.started, runrecord.ended = run_times
+        runrecord.exit_code = 0
+        runrecord.bind_output(output_snapshot.content_hash)
+        runrecord.seal()
+        
+        bundle = ZenodoBundle(input_snapshot, runrecord, output_snapshot)
+        bundle_dir = tmp_workspace / "bundle"
+        bundle.create_bundle(str(bundle_dir))
+        
+        result = verify_bundle(str(bundle_dir), str(sample_files))
+        
+        assert result.outcome.value == "PASS_INPUT_INTEGRITY"
+        assert len(result.errors) == 0
+    
+    def test_bundle_failure_skips_data_verification(self, tmp_workspace, sample_file, run_times):
+        """A failed bundle must not proceed to data verification."""
+        from reprohash import create_snapshot, RunRecord, ZenodoBundle
+        from reprohash.bundle import verify_bundle
+        
+        snapshot = create_snapshot(str(sample_file.parent))
+        
+        runrecord = RunRecord(snapshot.content_hash, "python test.py")
+        runrecord.started, runrecord.ended = run_times
+        runrecord.exit_code = 0
+        runrecord.seal()
+        
+        bundle = ZenodoBundle(snapshot, runrecord)
+        bundle_dir = tmp_workspace / "bundle"
+        bundle.create_bundle(str(bundle_dir))
+        
+        (bundle_dir / "runrecord.json").unlink()
+        
+        # Data directory is missing too; it must not be reached
+        result = verify_bundle(str(bundle_dir), str(tmp_workspace / "nonexistent"))
+        
+        assert result.outcome.value == "FAIL"
+        assert any("missing" in err.lower() for err in result.errors)
+        assert not any("Data verification" in r for r in result.inconclusive_reasons)
+    
+    def test_manifest_without_content_hash_inconclusive(self, tmp_workspace, sample_file, run_times):
+        """A resealed manifest lacking content_hash is INCONCLUSIVE, not an error."""
+        import hashlib
+        from reprohash import create_snapshot, RunRecord, ZenodoBundle
+        from reprohash.bundle import verify_bundle, canonical_json
+        
+        snapshot = create_snapshot(str(sample_file.parent))
+        
+        runrecord = RunRecord(snapshot.content_hash, "python test.py")
+        runrecord.started, runrecord.ended = run_times
+        runrecord.exit_code = 0
+        runrecord.seal()
+        
+        bundle = ZenodoBundle(snapshot, runrecord)
+        bundle_dir = tmp_workspace / "bundle"
+        bundle.create_bundle(str(bundle_dir))
+        
+        # Drop content_hash and reseal so the bundle seal still holds
+        manifest_file = bundle_dir / "MANIFEST.json"
+        manifest = json.loads(manifest_file.read_text())
+        del manifest['components']['input_snapshot']['content_hash']
+        manifest['bundle_hash'] = hashlib.sha256(canonical_json({
+            "version": manifest['version'],
+            "bundle_type": manifest['bundle_type'],
+            "verification_profile": manifest.get('verification_profile'),
+            "components": manifest['components']
+        }).encode('utf-8')).hexdigest()
+        manifest_file.write_text(json.dumps(manifest))
+        
+        result = verify_bundle(str(bundle_dir))
+        
+        assert result.outcome.value == "INCONCLUSIVE"
+        assert any("Could not verify snapshot seal" in r for r in result.inconclusive_reasons)
+        assert any("Could not verify provenance chain" in r for r in result.inconclusive_reasons)
+    
+    def test_pretty_env_read_at_write_time(self, tmp_workspace, sample_file, run_times, monkeypatch):
+        """REPROHASH_PRETTY takes effect when set after reprohash.bundle is imported."""
+        from reprohash import create_snapshot, RunRecord, ZenodoBundle
+        from reprohash.bundle import verify_bundle
+        
+        snapshot = create_snapshot(str(sample_file.parent))
+        
+        runrecord = RunRecord(snapshot.content_hash, "python test.py")
+        runrecord.started, runrecord.ended = run_times
+        runrecord.exit_code = 0
+        runrecord.seal()
+        
+        for pretty in ("0", "1"):
+            monkeypatch.setenv("REPROHASH_PRETTY", pretty)
+            bundle_dir = tmp_workspace / f"bundle{pretty}"
+            ZenodoBundle(snapshot, runrecord).create_bundle(str(bundle_dir))
+            
+            text = (bundle_dir / "runrecord.json").read_text()
+            assert ('\n  "' in text) == (pretty == "1")
+            assert verify_bundle(str(bundle_dir)).outcome.value == "PASS_INPUT_INTEGRITY"
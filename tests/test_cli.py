@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+CLI test suite.
+
+Tests command execution, argument parsing and output writing.
+"""
+
+import pytest
+import json
+
+
+class TestExecute:
+    """Test command execution and exit codes."""
+    
+    def test_exit_codes_pass_through(self):
+        """Exit codes of spawned commands are returned unchanged."""
+        from reprohash.cli import _execute
+        
+        assert _execute("true") == 0
+        assert _execute("false") == 1
+        assert _execute("sh -c 'exit 3'") == 3
+    
+    def test_missing_command_exits_127(self):
+        """A command that cannot be found exits 127, as in a shell."""
+        from reprohash.cli import _execute
+        
+        assert _execute("reprohash-no-such-command-xyz") == 127
+        assert _execute("reprohash-no-such-command-xyz --flag") == 127
+    
+    def test_shell_syntax_uses_shell(self, monkeypatch):
+        """Metacharacters and builtins go through /bin/sh -c."""
+        from reprohash import cli
+        
+        spawned = []
+        spawn = cli._spawn
+        
+        def record(argv):
+            spawned.append(argv)
+            return spawn(argv)
+        
+        monkeypatch.setattr(cli, "_spawn", record)
+        
+        assert cli._execute("cd / && exit 5") == 5
+        assert spawned == [['/bin/sh', '-c', "cd / && exit 5"]]
+        
+        # Builtins have no binary to spawn, so they fall back to the shell
+        spawned.clear()
+        assert cli._execute("exit 4") == 4
+        assert spawned[-1] == ['/bin/sh', '-c', "exit 4"]
+        
+        # Plain commands are spawned directly
+        spawned.clear()
+        assert cli._execute("true") == 0
+        assert spawned == [["true"]]
+    
+    def test_signal_reported_as_negative(self):
+        """A command killed by a signal returns minus the signal number."""
+        import signal
+        from reprohash.cli import _spawn
+        
+        assert _spawn(['/bin/sh', '-c', 'kill -TERM $$']) == -signal.SIGTERM
+
+
+class TestParseArgs:
+    """Test that every subcommand parses its own arguments."""
+    
+    def test_each_command_parses(self):
+        """Each command accepts its documented arguments."""
+        from reprohash.cli import _parse_args, COMMANDS
+        
+        cases = {
+            'snapshot': (
+                ['data', '-o', 'snap.json', '--source', 'drive'],
+                {'directory': 'data', 'output': 'snap.json', 'source': 'drive'}
+            ),
+            'run': (
+                ['--input-hash', 'abc', '--exec', 'make all', '-o', 'rr.json',
+                 '--reproducibility-class', 'deterministic',
+                 '--env-plugin', 'pip', '--env-plugin', 'conda'],
+                {'input_hash': 'abc', 'exec': 'make all', 'output': 'rr.json',
+                 'reproducibility_class': 'deterministic',
+                 'env_plugin': ['pip', 'conda']}
+            ),
+            'verify': (
+                ['snap.json', '-d', 'data'],
+                {'snapshot': 'snap.json', 'directory': 'data'}
+            ),
+            'verify-runrecord': (
+                ['rr.json'],
+                {'runrecord': 'rr.json'}
+            ),
+            'verify-bundle': (
+                ['bundle', '--data-dir', 'data'],
+                {'bundle_dir': 'bundle', 'data_dir': 'data'}
+            ),
+            'create-bundle': (
+                ['--input-snapshot', 'in.json', '--runrecord', 'rr.json',
+                 '--output-snapshot', 'out.json', '-o', 'bundle'],
+                {'input_snapshot': 'in.json', 'runrecord': 'rr.json',
+                 'output_snapshot': 'out.json', 'output': 'bundle'}
+            ),
+            'compare-environments': (
+                ['a.json', 'b.json', '--json'],
+                {'runrecord1': 'a.json', 'runrecord2': 'b.json', 'json': True}
+            ),
+        }
+        assert set(cases) == set(COMMANDS)
+        
+        for command, (argv, expected) in cases.items():
+            args = _parse_args([command] + argv)
+            assert args.command == command
+            for name, value in expected.items():
+                assert getattr(args, name) == value
+    
+    def test_defaults_and_required(self):
+        """Defaults apply and missing required arguments are rejected."""
+        from reprohash.cli import _parse_args
+        
+        args = _parse_args(['snapshot', 'data', '-o', 'snap.json'])
+        assert args.source == 'posix'
+        
+        args = _parse_args(['run', '--input-hash', 'abc', '--exec', 'true',
+                            '-o', 'rr.json'])
+        assert args.reproducibility_class == 'unknown'
+        assert args.env_plugin is None
+        
+        with pytest.raises(SystemExit):
+            _parse_args(['verify', 'snap.json'])
+        
+        with pytest.raises(SystemExit):
+            _parse_args(['no-such-command'])
+
+
+class TestDumpJson:
+    """Test atomic JSON output."""
+    
+    def test_write_leaves_no_temp_file(self, tmp_workspace):
+        """Buffered and streamed writes replace the target, no .tmp left."""
+        from reprohash.cli import _dump_json
+        
+        obj = {"files": [{"path": "a.txt", "size": 1}], "note": "café"}
+        output = tmp_workspace / "out.json"
+        
+        for stream in (False, True):
+            output.write_text("stale")
+            _dump_json(str(output), obj, stream=stream)
+        
+            assert json.loads(output.read_text()) == obj
+            assert sorted(p.name for p in tmp_workspace.iterdir()) == ["out.json"]
+    
+    def test_failed_write_keeps_target(self, tmp_workspace):
+        """An encoding error leaves the old file and removes the .tmp."""
+        from reprohash.cli import _dump_json
+        
+        output = tmp_workspace / "out.json"
+        output.write_text("previous")
+        
+        for stream in (False, True):
+            with pytest.raises(TypeError):
+                _dump_json(str(output), {"bad": object()}, stream=stream)
+        
+            assert output.read_text() == "previous"
+            assert sorted(p.name for p in tmp_workspace.iterdir()) == ["out.json"]
+    
+    def test_existing_tmp_name_untouched(self, tmp_workspace):
+        """A real file named <output>.tmp is neither used nor removed."""
+        import os
+        from reprohash.cli import _dump_json
+        
+        output = tmp_workspace / "out.json"
+        neighbour = tmp_workspace / "out.json.tmp"
+        neighbour.write_text("keep me")
+        
+        _dump_json(str(output), {"a": 1})
+        
+        assert neighbour.read_text() == "keep me"
+        assert json.loads(output.read_text()) == {"a": 1}
+        assert sorted(p.name for p in tmp_workspace.iterdir()) == ["out.json", "out.json.tmp"]
+        
+        umask = os.umask(0)
+        os.umask(umask)
+        assert os.stat(output).st_mode & 0o777 == 0o666 & ~umask
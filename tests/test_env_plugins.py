@@ -43,6 +43,58 @@ class TestPluginBase:
         # Should have capture method
         assert data['capture_method'] == 'importlib.metadata'
     
+    def test_package_scan_cached(self):
+        """Installed distributions are rescanned only when sys.path changes."""
+        from reprohash.env_plugins import _collect_packages, _path_signature
+        
+        plugin = PipEnvironmentPlugin()
+        first = plugin.capture()
+        hits = _collect_packages.cache_info().hits
+        second = plugin.capture()
+        
+        assert _collect_packages.cache_info().hits == hits + 1
+        assert first['packages'] == second['packages']
+        
+        # A changed metadata record is a new cache key
+        changed = _path_signature() + (("changed/METADATA", 0, 0, 0),)
+        misses = _collect_packages.cache_info().misses
+        assert dict(_collect_packages(changed)) == first['packages']
+        assert _collect_packages.cache_info().misses == misses + 1
+    
+    def test_in_place_upgrade_seen(self, tmp_workspace, monkeypatch):
+        """An upgrade is captured even when site-packages' mtime is unchanged."""
+        import os
+        import shutil
+        
+        site = tmp_workspace / "site"
+        site.mkdir()
+        monkeypatch.syspath_prepend(str(site))
+        
+        def install(version):
+            dist_info = site / f"reprohash_fakepkg-{version}.dist-info"
+            dist_info.mkdir()
+            (dist_info / "METADATA").write_text(
+                f"Metadata-Version: 2.1\nName: reprohash-fakepkg\nVersion: {version}\n"
+            )
+        
+        plugin = PipEnvironmentPlugin()
+        install("1.0")
+        assert plugin.capture()['packages']['reprohash-fakepkg'] == "1.0"
+        
+        # Upgrade, then restore the directory mtime as a same-tick change would
+        stat = os.stat(site)
+        shutil.rmtree(site / "reprohash_fakepkg-1.0.dist-info")
+        install("2.0")
+        os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert plugin.capture()['packages']['reprohash-fakepkg'] == "2.0"
+        
+        # Rewriting METADATA in place (same dist-info name) is seen too
+        (site / "reprohash_fakepkg-2.0.dist-info" / "METADATA").write_text(
+            "Metadata-Version: 2.1\nName: reprohash-fakepkg\nVersion: 2.0.post1\n"
+        )
+        os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert plugin.capture()['packages']['reprohash-fakepkg'] == "2.0.post1"
+    
     def test_plugin_envelope(self):
         """Test that plugin wraps data in standard envelope."""
         plugin = PipEnvironmentPlugin()
@@ -56,6 +108,35 @@ class TestPluginBase:
         assert 'timestamp' in envelope
         assert 'data' in envelope
     
+    def test_envelope_timestamp_not_hashed(self):
+        """Test that a supplied timestamp is used but not hashed."""
+        plugin = PipEnvironmentPlugin()
+        data = plugin.capture()
+        
+        early = plugin.get_envelope(data, timestamp=1234567890.0)
+        late = plugin.get_envelope(data, timestamp=1234567999.0)
+        
+        assert early['timestamp'] == 1234567890.0
+        assert plugin.get_fingerprint_hash(early) == plugin.get_fingerprint_hash(late)
+    
+    def test_capture_passes_timestamp(self):
+        """Test that capture_with_envelope stamps the capture once."""
+        import time
+        from unittest import mock
+        
+        plugin = PipEnvironmentPlugin()
+        
+        with mock.patch.object(
+            plugin, 'get_envelope', wraps=plugin.get_envelope
+        ) as get_envelope:
+            before = time.time()
+            envelope = plugin.capture_with_envelope()
+            after = time.time()
+        
+        (data, timestamp), _ = get_envelope.call_args
+        assert before <= timestamp <= after
+        assert envelope['timestamp'] == timestamp
+    
     def test_plugin_fingerprint_hash(self):
         """Test fingerprint hash computation."""
         plugin = PipEnvironmentPlugin()
@@ -101,6 +182,14 @@ class TestPluginRegistry:
         """Test getting nonexistent plugin."""
         plugin_class = PluginRegistry.get('nonexistent')
         assert plugin_class is None
+    
+    def test_registry_instance_shared(self):
+        """Test that one plugin instance is reused."""
+        plugin = PluginRegistry.get_instance('pip')
+        
+        assert isinstance(plugin, PipEnvironmentPlugin)
+        assert PluginRegistry.get_instance('pip') is plugin
+        assert PluginRegistry.get_instance('nonexistent') is None
 
 
 class TestEnvironmentCapture:
@@ -115,6 +204,18 @@ class TestEnvironmentCapture:
         assert metadata.plugin_name == 'pip'
         assert len(metadata.fingerprint_hash) == 64
         assert metadata.summary is not None
+        assert metadata._full_envelope is not None
+    
+    def test_full_envelope_not_a_constructor_argument(self):
+        """Test that the private envelope is only set after construction."""
+        metadata = EnvironmentMetadata("0" * 64, "pip", "1.0", "reprohash.env.v1", {})
+        assert metadata._full_envelope is None
+        
+        with pytest.raises(TypeError):
+            EnvironmentMetadata(
+                "0" * 64, "pip", "1.0", "reprohash.env.v1", {},
+                _full_envelope={}
+            )
     
     def test_capture_without_plugins(self):
         """Test that no plugins returns None."""
@@ -236,7 +337,7 @@ class TestEnvironmentVerification:
         assert result['verified'] is True
         assert len(result['errors']) == 0
     
-    def test_verify_with_tampered_fingerprint(self):
+    def test_verify_with_tampered_fingerprint(self, tmp_workspace):
         """Test that tampering with fingerprint is detected."""
         rr = RunRecord('abc123', 'python test.py', env_plugins=['pip'])
         rr.started = 1234567890.0
@@ -249,36 +350,18 @@ class TestEnvironmentVerification:
         # Tamper with fingerprint
         rr_dict['environment_metadata']['fingerprint_hash'] = 'tampered'
         
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(rr_dict, f)
-            temp_file = f.name
-        
-        # Create fake environment file
-        temp_dir = Path(temp_file).parent
-        env_file = temp_dir / 'environment_pip.json'
-        
-        with open(env_file, 'w') as f:
-            # Write valid environment data
-            env_data = rr.env_metadata._full_envelope
-            json.dump(env_data, f)
-        
-        # Update path in RunRecord
+        # Write valid environment data where the bundle would hold it
+        (tmp_workspace / 'environment_pip.json').write_text(
+            json.dumps(rr.env_metadata._full_envelope)
+        )
         rr_dict['environment_metadata']['full_data_file'] = 'environment_pip.json'
         
-        with open(temp_file, 'w') as f:
-            json.dump(rr_dict, f)
-        
         # Verify with bundle directory
-        result = verify_environment_metadata(rr_dict, temp_dir)
+        result = verify_environment_metadata(rr_dict, tmp_workspace)
         
         # Should detect mismatch
         assert result['verified'] is False
         assert any('hash mismatch' in e.lower() for e in result['errors'])
-        
-        # Cleanup
-        Path(temp_file).unlink()
-        env_file.unlink()
 
 
 class TestEnvironmentComparison:
@@ -312,6 +395,28 @@ class TestEnvironmentComparison:
         assert result['comparable'] is True
         assert result['identical'] is True
     
+    def test_compare_reports_package_differences(self):
+        """Changed, added and removed key packages are reported in order."""
+        def runrecord(fingerprint, key_packages):
+            return {
+                "environment_metadata": {
+                    "fingerprint_hash": fingerprint * 64,
+                    "summary": {"python": "3.11.7", "key_packages": key_packages}
+                }
+            }
+        
+        rr1 = runrecord("a", {"numpy": "1.26.0", "torch": "2.1.0", "scipy": "1.11.0"})
+        rr2 = runrecord("b", {"numpy": "2.0.0", "torch": "2.1.0", "pandas": "2.2.0"})
+        
+        result = compare_environment_metadata(rr1, rr2)
+        
+        assert result['identical'] is False
+        assert result['differences'] == [
+            "numpy: 1.26.0 vs 2.0.0",
+            "pandas: not installed vs 2.2.0",
+            "scipy: 1.11.0 vs not installed",
+        ]
+    
     def test_compare_without_environment(self):
         """Test comparing RunRecords without environment metadata."""
         rr1 = RunRecord('abc123', 'python test.py', env_plugins=None)
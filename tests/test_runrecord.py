@@ -6,7 +6,6 @@ Tests sealing enforcement and linear provenance.
 """
 
 import pytest
-import time
 
 
 class TestRunRecord:
@@ -22,13 +21,12 @@ class TestRunRecord:
         with pytest.raises(RuntimeError, match="must be sealed"):
             runrecord.to_dict()
     
-    def test_seal_required_before_export(self):
+    def test_seal_required_before_export(self, run_times):
         """Seal is required before export."""
         from reprohash import RunRecord
         
         runrecord = RunRecord("abc123", "python train.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 10
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         
         # Seal
@@ -41,13 +39,12 @@ class TestRunRecord:
         assert runrecord_dict['integrity']['tamper_evident'] is True
         assert runrecord_dict['integrity']['authenticated'] is False
     
-    def test_seal_prevents_mutation(self):
+    def test_seal_prevents_mutation(self, run_times):
         """Sealed record detects mutation."""
         from reprohash import RunRecord
         
         runrecord = RunRecord("abc123", "python train.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 10
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         
         runrecord.seal()
@@ -94,26 +91,24 @@ class TestRunRecord:
         # Should pass again with original values
         assert runrecord.verify_seal() is True
     
-    def test_double_seal_fails(self):
+    def test_double_seal_fails(self, run_times):
         """Cannot seal twice."""
         from reprohash import RunRecord
         
         runrecord = RunRecord("abc123", "python train.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 1
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         runrecord.seal()
         
         with pytest.raises(RuntimeError, match="already sealed"):
             runrecord.seal()
     
-    def test_provenance_summary_informational(self):
+    def test_provenance_summary_informational(self, run_times):
         """provenance_summary is informational, not cryptographic."""
         from reprohash import RunRecord
         
         runrecord = RunRecord("input_abc", "python train.py")
-        runrecord.started = time.time()
-        runrecord.ended = time.time() + 1
+        runrecord.started, runrecord.ended = run_times
         runrecord.exit_code = 0
         runrecord.bind_output("output_xyz")
         runrecord.seal()
@@ -140,3 +135,33 @@ class TestRunRecord:
         
         runrecord.bind_output("output_2")  # Overwrites
         assert runrecord.output_snapshot_hash == "output_2"
+    
+    def test_minimal_environment_not_shared(self):
+        """Cached platform info still gives each record its own dict."""
+        import platform
+        from reprohash import RunRecord
+        
+        first = RunRecord("abc123", "python train.py")
+        second = RunRecord("abc123", "python train.py")
+        
+        assert first.environment == second.environment
+        assert first.environment["platform"] == platform.platform()
+        
+        first.environment["platform"] = "tampered"
+        assert second.environment["platform"] == platform.platform()
+    
+    def test_export_timestamps_follow_raw_values(self):
+        """ISO timestamps in to_dict always reflect started/ended."""
+        from reprohash import RunRecord
+        
+        runrecord = RunRecord("abc123", "python train.py")
+        runrecord.started = 1700000000.25
+        runrecord.ended = 1700000061.9
+        runrecord.seal()
+        
+        execution = runrecord.to_dict()["execution"]
+        assert execution["started_at"] == "2023-11-14T22:13:20Z"
+        assert execution["ended_at"] == "2023-11-14T22:14:21Z"
+        
+        runrecord.ended = 1700003600.0
+        assert runrecord.to_dict()["execution"]["ended_at"] == "2023-11-14T23:13:20Z"
@@ -6,7 +6,7 @@ Tests mechanical enforcement of hash scope.
 """
 
 import pytest
-import json
+from pathlib import Path
 
 
 class TestSnapshot:
@@ -68,6 +68,81 @@ class TestSnapshot:
         assert paths == sorted(paths)
         assert paths == ["a.txt", "m.txt", "z.txt"]
     
+    def test_file_hashes_match_content(self, tmp_workspace):
+        """Streamed, concurrent hashing matches hashing whole contents."""
+        import hashlib
+        from reprohash import create_snapshot
+        
+        contents = {
+            "empty.bin": b"",
+            "small.txt": b"hello",
+            "nested/large.bin": bytes(range(256)) * 10000,  # > one read chunk
+        }
+        for rel_path, content in contents.items():
+            path = tmp_workspace / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        
+        snapshot = create_snapshot(str(tmp_workspace))
+        files = {f["path"]: f for f in snapshot.to_dict()["hashable_manifest"]["files"]}
+        
+        assert len(files) == len(contents)
+        for rel_path, content in contents.items():
+            entry = files[str(Path(rel_path))]
+            assert entry["sha256"] == hashlib.sha256(content).hexdigest()
+            assert entry["size"] == len(content)
+    
+    def test_file_walk_matches_rglob(self, tmp_workspace):
+        """Directory walk selects the same files as rglob."""
+        from reprohash.snapshot import _iter_files
+        
+        data = tmp_workspace / "data"
+        (data / "sub" / "deeper").mkdir(parents=True)
+        (data / "top.txt").write_text("top")
+        (data / ".hidden").write_text("hidden")
+        (data / "sub" / "deeper" / "leaf.txt").write_text("leaf")
+        (data / "empty").mkdir()
+        (data / "link.txt").symlink_to(data / "top.txt")
+        (data / "linkdir").symlink_to(data / "sub", target_is_directory=True)
+        
+        expected = {
+            str(path.relative_to(data))
+            for path in data.rglob("*") if path.is_file()
+        }
+        walked = dict(_iter_files(str(data)))
+        
+        assert set(walked) == expected
+        assert walked[str(Path("sub/deeper/leaf.txt"))] == str(data / "sub" / "deeper" / "leaf.txt")
+    
+    def test_unlistable_root_gives_empty_snapshot(self, sample_file):
+        """Missing or non-directory roots snapshot as empty, like rglob."""
+        from reprohash import create_snapshot
+        
+        for root in (sample_file.parent / "nonexistent", sample_file):
+            snapshot = create_snapshot(str(root))
+            assert snapshot.to_dict()["hashable_manifest"]["files"] == []
+    
+    def test_streamed_hash_across_batch_boundary(self):
+        """Streamed digest equals SHA256(canonical_json) for any files sequence."""
+        import hashlib
+        from reprohash.snapshot import (
+            HashableManifest, canonical_json, MANIFEST_HASH_BATCH
+        )
+        
+        files = [
+            {"path": f"f{i:06d}.txt", "sha256": f"{i:064x}", "size": i}
+            for i in range(MANIFEST_HASH_BATCH + 1)
+        ]
+        manifest = HashableManifest(version="2.1", source_type="posix", files=files)
+        expected = hashlib.sha256(
+            canonical_json(manifest.to_hashable_dict()).encode('utf-8')
+        ).hexdigest()
+        
+        assert manifest.compute_hash() == expected
+        
+        as_tuple = HashableManifest(version="2.1", source_type="posix", files=tuple(files))
+        assert as_tuple.compute_hash() == expected
+    
     def test_finalization_required(self, sample_file):
         """Cannot access hash before finalization."""
         from reprohash import Snapshot, SourceType
@@ -97,6 +172,67 @@ class TestSnapshot:
         with pytest.raises(RuntimeError, match="after finalization"):
             snapshot.add_file("test2.txt", "def456", 200)
     
+    def test_add_files_matches_add_file(self):
+        """Bulk add_files produces the same hash as add_file."""
+        from reprohash import Snapshot, SourceType
+        
+        records = [("b.txt", "def456", 200), ("a.txt", "abc123", 100)]
+        
+        single = Snapshot(SourceType.POSIX)
+        for record in records:
+            single.add_file(*record)
+        
+        bulk = Snapshot(SourceType.POSIX)
+        bulk.add_files(iter(records))
+        
+        assert bulk.finalize() == single.finalize()
+        
+        with pytest.raises(RuntimeError, match="after finalization"):
+            bulk.add_files([("c.txt", "789abc", 300)])
+    
+    def test_from_hashable_manifest_round_trip(self, sample_file):
+        """Exported snapshot rebuilds without rehashing."""
+        from reprohash import Snapshot, create_snapshot, SourceType
+        
+        original = create_snapshot(str(sample_file.parent), SourceType.DRIVE)
+        exported = original.to_dict()
+        
+        rebuilt = Snapshot.from_hashable_manifest(
+            exported['hashable_manifest'],
+            exported['content_hash'],
+            created_at=exported['created_at'],
+            annotations=exported['annotations']
+        )
+        
+        assert rebuilt.content_hash == original.content_hash
+        assert rebuilt.to_dict() == exported
+        assert rebuilt.verify_hash() is True
+        
+        with pytest.raises(RuntimeError, match="after finalization"):
+            rebuilt.add_file("extra.txt", "abc123", 1)
+        
+        # Stored hash is attached as is; verify_hash detects a mismatch
+        forged = Snapshot.from_hashable_manifest(
+            exported['hashable_manifest'], "0" * 64
+        )
+        assert forged.verify_hash() is False
+    
+    def test_from_hashable_manifest_copies_files(self, sample_file):
+        """Changing the source manifest afterwards leaves the snapshot sealed."""
+        from reprohash import Snapshot, create_snapshot
+        
+        exported = create_snapshot(str(sample_file.parent)).to_dict()
+        manifest = exported['hashable_manifest']
+        rebuilt = Snapshot.from_hashable_manifest(manifest, exported['content_hash'])
+        
+        manifest['files'][0]['sha256'] = "0" * 64
+        manifest['files'].append({"path": "extra.txt", "sha256": "abc123", "size": 1})
+        
+        assert rebuilt.verify_hash() is True
+        assert len(rebuilt.files) == 1
+        assert rebuilt.files[0]['sha256'] != "0" * 64
+        assert len(rebuilt.to_dict()['hashable_manifest']['files']) == 1
+    
     def test_annotations_after_finalization_only(self, sample_file):
         """Annotations can only be added after finalization."""
         from reprohash import Snapshot, SourceType
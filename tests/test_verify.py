@@ -44,6 +44,24 @@ class TestEpistemicOutcomes:
         assert result.outcome.value == "FAIL"
         assert any("CHANGED" in err for err in result.errors)
     
+    def test_fail_when_file_changed_same_size(self, sample_files):
+        """Size pre-check does not hide same-size modifications."""
+        from reprohash import create_snapshot, verify_snapshot
+        
+        snapshot = create_snapshot(str(sample_files))
+        snapshot_file = sample_files.parent / "snapshot.json"
+        snapshot_file.write_text(json.dumps(snapshot.to_dict()))
+        
+        (sample_files / "file1.txt").write_text("CONTENT1")
+        (sample_files / "file2.txt").write_text("longer content")
+        
+        result = verify_snapshot(str(snapshot_file), str(sample_files))
+        
+        assert result.outcome.value == "FAIL"
+        assert len(result.errors) == 2
+        assert any("file1.txt" in err and "expected:" in err for err in result.errors)
+        assert any("size differs" in err and "file2.txt" in err for err in result.errors)
+    
     def test_inconclusive_when_snapshot_missing(self, tmp_workspace):
         """INCONCLUSIVE when verification infrastructure unavailable."""
         from reprohash import verify_snapshot
@@ -91,6 +109,65 @@ class TestEpistemicOutcomes:
         assert result.outcome.value == "FAIL"
         assert any("MISSING" in err for err in result.errors)
     
+    def test_missing_and_extra_files_reported(self, sample_files):
+        """Missing files FAIL, extra files only warn."""
+        from reprohash import create_snapshot, verify_snapshot
+        
+        snapshot = create_snapshot(str(sample_files))
+        snapshot_file = sample_files.parent / "snapshot.json"
+        snapshot_file.write_text(json.dumps(snapshot.to_dict()))
+        
+        (sample_files / "file3.txt").unlink()
+        (sample_files / "nested").mkdir()
+        (sample_files / "nested" / "extra.txt").write_text("extra")
+        
+        result = verify_snapshot(str(snapshot_file), str(sample_files))
+        
+        assert result.outcome.value == "FAIL"
+        assert result.errors == ["File MISSING (integrity violation): file3.txt"]
+        assert result.warnings == ["Found 1 files not in snapshot"]
+    
+    def test_pass_with_symlinked_subdirectory(self, tmp_workspace):
+        """Files reached through a symlinked directory are not MISSING."""
+        import shutil
+        from reprohash import create_snapshot, verify_snapshot
+        
+        data = tmp_workspace / "data"
+        (data / "sub").mkdir(parents=True)
+        (data / "top.txt").write_text("top")
+        (data / "sub" / "inner.txt").write_text("inner")
+        
+        snapshot = create_snapshot(str(data))
+        snapshot_file = tmp_workspace / "snapshot.json"
+        snapshot_file.write_text(json.dumps(snapshot.to_dict()))
+        
+        # On the verifying machine the subdirectory lives elsewhere
+        shutil.move(str(data / "sub"), str(tmp_workspace / "elsewhere"))
+        (data / "sub").symlink_to(tmp_workspace / "elsewhere", target_is_directory=True)
+        
+        result = verify_snapshot(str(snapshot_file), str(data))
+        
+        assert result.outcome.value == "PASS_INPUT_INTEGRITY"
+        assert result.errors == []
+        assert result.warnings == []
+    
+    def test_inconclusive_when_file_became_directory(self, sample_files):
+        """A manifest file replaced by a directory cannot be read: INCONCLUSIVE."""
+        from reprohash import create_snapshot, verify_snapshot
+        
+        snapshot = create_snapshot(str(sample_files))
+        snapshot_file = sample_files.parent / "snapshot.json"
+        snapshot_file.write_text(json.dumps(snapshot.to_dict()))
+        
+        (sample_files / "file1.txt").unlink()
+        (sample_files / "file1.txt").mkdir()
+        
+        result = verify_snapshot(str(snapshot_file), str(sample_files))
+        
+        assert result.outcome.value == "INCONCLUSIVE"
+        assert result.errors == []
+        assert any("file1.txt" in r for r in result.inconclusive_reasons)
+    
     def test_fail_on_corrupted_manifest(self, tmp_workspace, sample_file):
         """Corrupted manifest causes FAIL."""
         from reprohash import create_snapshot, verify_snapshot
@@ -162,3 +239,43 @@ class TestSpecConformance:
         # Must be identical
         assert hash1 == hash2
         assert len(hash1) == 64  # SHA-256
+    
+    def test_streamed_hash_matches_canonical_json(self):
+        """Batched manifest hashing equals SHA256(canonical_json(manifest))."""
+        import hashlib
+        from reprohash.snapshot import (
+            HashableManifest, canonical_json, MANIFEST_HASH_BATCH
+        )
+        
+        for count in (0, 1, MANIFEST_HASH_BATCH, MANIFEST_HASH_BATCH + 1):
+            manifest = HashableManifest(
+                version="2.1",
+                source_type="posix",
+                files=[
+                    {"path": f"dir/café-{i}.txt", "sha256": f"{i:064x}", "size": i}
+                    for i in range(count)
+                ]
+            )
+            expected = hashlib.sha256(
+                canonical_json(manifest.to_hashable_dict()).encode('utf-8')
+            ).hexdigest()
+        
+            assert manifest.compute_hash() == expected
+    
+    def test_canonical_json_matches_reference(self):
+        """Canonicalizers must produce the reference json.dumps bytes."""
+        from reprohash import bundle, env_plugins, runrecord, snapshot
+        
+        obj = {
+            "version": "2.1",
+            "components": {
+                "input_snapshot": {"file": "snapshot.json", "content_hash": "abc"},
+                "runrecord": {"file": "runrecord.json", "runrecord_hash": None}
+            },
+            "note": "café → output",
+            "count": 42
+        }
+        
+        reference = json.dumps(obj, sort_keys=True, separators=(',', ':'))
+        for module in (bundle, env_plugins, runrecord, snapshot):
+            assert module.canonical_json(obj) == reference